@@ -1,16 +1,43 @@
-from flask import Flask, render_template, request, jsonify, session, redirect
+from flask import Flask, render_template, request, jsonify, session, redirect, send_from_directory
 from flask_cors import CORS
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
+from flask.logging import default_handler
+from flask.json.provider import DefaultJSONProvider
+from werkzeug.security import safe_join
 import os
+import mimetypes
+import atexit
+import queue
 import logging
-from logging.handlers import RotatingFileHandler
+from logging.handlers import RotatingFileHandler, MemoryHandler, QueueHandler, QueueListener
 from dotenv import load_dotenv
-from routes import api_bp
+from routes import api_bp, init_analyzer, analysis_store
+
+# Try to import orjson (optional, faster JSON encoding for API responses)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 load_dotenv()
 
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider that serializes responses with orjson"""
+
+    def dumps(self, obj, **kwargs):
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 app = Flask(__name__, template_folder='templates', static_folder='static')
+if ORJSON_AVAILABLE:
+    app.json = OrjsonProvider(app)
 CORS(app, resources={r"/api/*": {
     "origins": "*",
     "methods": ["GET", "POST", "OPTIONS"],
@@ -19,20 +46,88 @@ CORS(app, resources={r"/api/*": {
 
 # Configure session
 app.config['SECRET_KEY'] = os.getenv('SECRET_KEY', 'your-secret-key-change-in-production')
-app.config['SESSION_TYPE'] = 'filesystem'
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max
 
+# ==================== Logging ====================
+_log_listener = None
+
+def setup_logging():
+    """Configure console and file logging with rotation.
+
+    Records are pushed onto an in-memory queue and written to disk by a
+    background QueueListener, so request threads never block on file I/O.
+    The listener writes through a MemoryHandler that batches records and
+    flushes when the buffer fills, on ERROR, or at shutdown.
+    Safe to call more than once; only the first call installs handlers.
+    """
+    global _log_listener
+    if _log_listener is not None:
+        return
+    
+    os.makedirs('logs', exist_ok=True)
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    
+    file_handler = RotatingFileHandler(
+        'logs/app.log',
+        maxBytes=10 * 1024 * 1024,  # 10MB
+        backupCount=5
+    )
+    file_handler.setFormatter(formatter)
+    file_handler.setLevel(logging.INFO)
+    
+    buffer_handler = MemoryHandler(
+        capacity=int(os.getenv('LOG_BUFFER_CAPACITY', 1024)),
+        flushLevel=logging.ERROR,
+        target=file_handler,
+        flushOnClose=True
+    )
+    buffer_handler.setLevel(logging.INFO)
+    
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(formatter)
+    console_handler.setLevel(logging.INFO)
+    
+    log_queue = queue.Queue(-1)
+    _log_listener = QueueListener(log_queue, buffer_handler, console_handler, respect_handler_level=True)
+    _log_listener.start()
+    # atexit runs in reverse order: drain the queue first, then flush the buffer
+    atexit.register(buffer_handler.close)
+    atexit.register(_log_listener.stop)
+    
+    # Replace Flask's default stderr handler so each record is emitted once
+    queue_handler = QueueHandler(log_queue)
+    app.logger.removeHandler(default_handler)
+    for logger in (app.logger, logging.getLogger('routes')):
+        logger.addHandler(queue_handler)
+        logger.setLevel(logging.INFO)
+    
+    app.logger.info('JobGuard AI application started')
+
+# Configure at import time so WSGI servers (gunicorn app:app) get logging too
+setup_logging()
+
 # Rate Limiting
+# In-process memory counters are per worker; set RATELIMIT_STORAGE_URI
+# (e.g. redis://host:6379/0) so every worker shares the same limits.
+ratelimit_storage_uri = os.getenv('RATELIMIT_STORAGE_URI', 'memory://')
 limiter = Limiter(
     app=app,
     key_func=get_remote_address,
     default_limits=["200 per day", "50 per hour"],
-    storage_uri="memory://"
+    storage_uri=ratelimit_storage_uri
 )
+if ratelimit_storage_uri == 'memory://' and os.getenv('FLASK_DEBUG', 'True').lower() != 'true':
+    app.logger.warning('RATELIMIT_STORAGE_URI not set - rate limits are tracked per worker process')
 
 # Register blueprints
 app.register_blueprint(api_bp)
 
+# Load the model once at startup instead of on the first request
+try:
+    init_analyzer(app)
+except Exception as e:
+    app.logger.error('Analyzer failed to load; analysis requests will return 500: %s', e)
+
 # ==================== Security & CORS Headers ====================
 @app.after_request
 def add_headers(response):
@@ -50,24 +145,43 @@ def add_headers(response):
     response.headers['Permissions-Policy'] = 'geolocation=(), microphone=(), camera=()'
     return response
 
-# ==================== Logging ====================
-def setup_logging():
-    """Configure file-based logging with rotation."""
-    os.makedirs('logs', exist_ok=True)
-    
-    file_handler = RotatingFileHandler(
-        'logs/app.log',
-        maxBytes=10 * 1024 * 1024,  # 10MB
-        backupCount=5
-    )
-    file_handler.setFormatter(logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    ))
-    file_handler.setLevel(logging.INFO)
+# ==================== Static Assets ====================
+STATIC_MAX_AGE = 365 * 24 * 60 * 60  # 1 year
+
+@app.url_defaults
+def add_static_version(endpoint, values):
+    """Append the file's mtime to static URLs so they can be cached indefinitely"""
+    if endpoint != 'static' or 'v' in values or 'filename' not in values:
+        return
+    try:
+        values['v'] = int(os.stat(os.path.join(app.static_folder, values['filename'])).st_mtime)
+    except OSError:
+        pass
+
+def send_static(filename):
+    """Serve static files, preferring a pre-gzipped sibling when the client accepts it.
+
+    The .gz files are generated at build time (see Dockerfile), so nothing
+    is compressed per request.
+    """
+    gzipped = safe_join(app.static_folder, filename + '.gz')
+    if 'gzip' in request.headers.get('Accept-Encoding', '') and gzipped and os.path.isfile(gzipped):
+        mimetype = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+        response = send_from_directory(app.static_folder, filename + '.gz', mimetype=mimetype)
+        response.headers['Content-Encoding'] = 'gzip'
+    else:
+        response = app.send_static_file(filename)
+    response.vary.add('Accept-Encoding')
     
-    app.logger.addHandler(file_handler)
-    app.logger.setLevel(logging.INFO)
-    app.logger.info('JobGuard AI application started')
+    # Versioned URLs change whenever the file does, so they never go stale
+    if request.args.get('v'):
+        response.cache_control.no_cache = None
+        response.cache_control.public = True
+        response.cache_control.max_age = STATIC_MAX_AGE
+        response.cache_control.immutable = True
+    return response
+
+app.view_functions['static'] = send_static
 
 # ==================== Routes ====================
 @app.route('/')
@@ -78,7 +192,7 @@ def index():
 @app.route('/result')
 def result():
     """Result page"""
-    analysis = session.get('last_analysis', {})
+    analysis = analysis_store.load(session.get('analysis_id'))
     
     if not analysis:
         return redirect('/')
@@ -106,7 +220,7 @@ def internal_error(error):
     """Handle 500 errors"""
     import traceback
     tb = traceback.format_exc()
-    app.logger.error(f'Server Error: {error}\n{tb}')
+    app.logger.error('Server Error: %s\n%s', error, tb)
     return jsonify({
         'error': str(error),
         'traceback': tb,
@@ -127,9 +241,6 @@ if __name__ == '__main__':
     os.makedirs('data', exist_ok=True)
     os.makedirs('logs', exist_ok=True)
     
-    # Setup logging
-    setup_logging()
-    
     # Use environment config
     debug_mode = os.getenv('FLASK_DEBUG', 'True').lower() == 'true'
     port = int(os.getenv('API_PORT', 5000))
@@ -6,8 +6,7 @@ class Config:
     TESTING = False
     
     # Model paths
-    MODEL_PATH = os.path.join('models', 'fake_job_detector.h5')
-    VECTORIZER_PATH = os.path.join('models', 'tfidf_vectorizer.pkl')
+    MODEL_PATH = os.path.join('models', 'fake_job_detector.keras')
     
     # Scraping config
     SCRAPING_TIMEOUT = 10
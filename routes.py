@@ -1,48 +1,79 @@
-from flask import Blueprint, request, jsonify, session
+from flask import Blueprint, Response, current_app, request, jsonify, session, stream_with_context
 from src.analyzer import JobAnalyzer
+from src.analysis_store import AnalysisStore
+import os
 import logging
-from functools import wraps
+import re
+import string
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache, wraps
 from markupsafe import escape
+from urllib.parse import urlparse
 
-# Setup logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# Handlers are attached by setup_logging() in app.py
 logger = logging.getLogger(__name__)
 
+# Input classification patterns (compiled once at import)
+_URL_PREFIXES = ('http://', 'https://', 'www.')
+_URL_RE = re.compile(
+    r'linkedin\.com|naukri\.com|indeed\.com|internshala\.com|jobs\.|\.com/jobs|/job',
+    re.IGNORECASE
+)
+_TEXT_KW_RE = re.compile(
+    r'responsibilities|requirements|qualifications|skills|experience|salary|company|location|benefits',
+    re.IGNORECASE
+)
+_PROFESSIONAL_KW_RE = re.compile(
+    r'responsibilities|requirements|qualifications|skills|experience|education|benefits|salary|compensation',
+    re.IGNORECASE
+)
+
+# Supported portal domains, matched against the URL host
+_DOMAIN_TO_PORTAL = {
+    'linkedin.com': 'linkedin',
+    'naukri.com': 'naukri',
+    'indeed.com': 'indeed',
+    'internshala.com': 'internshala'
+}
+_SUSPICIOUS_HOST_RE = re.compile(r'bit\.ly|tinyurl|goo\.gl|temp-mail|10minutemail')
+
+# Strips ASCII letters/digits and allowed punctuation so only candidate special chars remain
+_DELETE_ALLOWED = str.maketrans('', '', string.ascii_letters + string.digits + ' .,!?-()')
+
+# Upper bound on concurrent analyses per /analyze-batch request
+BATCH_MAX_WORKERS = 16
+
+# Largest request body accepted by /analyze (batch requests are bounded by MAX_CONTENT_LENGTH)
+ANALYZE_MAX_PAYLOAD = 64 * 1024
+
 # Create blueprint
 api_bp = Blueprint('api', __name__, url_prefix='/api')
 
-# Initialize analyzer (lazy loading)
-_analyzer = None
+# Server-side store for results shown on the /result page
+analysis_store = AnalysisStore(os.getenv('REDIS_URL'))
+
+def init_analyzer(app):
+    """Create the app's analyzer at startup so requests never pay the model load cost"""
+    analyzer = app.extensions['analyzer'] = JobAnalyzer()
+    return analyzer.warm_up()
 
 def get_analyzer():
-    """Get or create analyzer instance"""
-    global _analyzer
-    if _analyzer is None:
-        _analyzer = JobAnalyzer()
-    return _analyzer
+    """The app's analyzer, created here if startup initialization did not run"""
+    analyzer = current_app.extensions.get('analyzer')
+    if analyzer is None:
+        analyzer = current_app.extensions.setdefault('analyzer', JobAnalyzer())
+    return analyzer
 
 def detect_input_type(job_input):
     """Auto-detect if input is URL or text"""
     job_input = job_input.strip()
 
-    # Check if it looks like a URL
-    if (job_input.startswith(('http://', 'https://', 'www.')) or
-        '://' in job_input or
-        any(domain in job_input.lower() for domain in [
-            'linkedin.com', 'naukri.com', 'indeed.com', 'internshala.com',
-            'jobs.', '.com/jobs', '/job'
-        ])):
+    # Check if it looks like a URL (cheap prefix checks before the regex scan)
+    if job_input.startswith(_URL_PREFIXES) or '://' in job_input or _URL_RE.search(job_input):
         return 'url'
 
     # Check if it looks like job description text
-    if (len(job_input) > 100 and
-        any(keyword in job_input.lower() for keyword in [
-            'responsibilities', 'requirements', 'qualifications', 'skills',
-            'experience', 'salary', 'company', 'location', 'benefits'
-        ])):
+    if len(job_input) > 100 and _TEXT_KW_RE.search(job_input):
         return 'text'
 
     # Default to URL if it contains common URL patterns
@@ -68,7 +99,6 @@ def validate_job_input(job_input, input_type):
 
         # Check if URL is accessible
         try:
-            from urllib.parse import urlparse
             parsed = urlparse(job_input)
             if not parsed.netloc:
                 result['valid'] = False
@@ -79,28 +109,26 @@ def validate_job_input(job_input, input_type):
             result['error'] = 'Invalid URL format'
             return result
 
-        # Detect job portal
-        job_input_lower = job_input.lower()
-        portals = {
-            'linkedin': 'linkedin.com',
-            'naukri': 'naukri.com',
-            'indeed': 'indeed.com',
-            'internshala': 'internshala.com'
-        }
+        # Hand the parsed URL on so the scraper doesn't parse it again
+        result['parsed_url'] = parsed
 
-        for portal_name, domain in portals.items():
-            if domain in job_input_lower:
-                result['portal'] = portal_name
-                break
-
-        if not result['portal']:
-            result['warnings'].append('URL is not from a supported job portal. Analysis may be limited.')
+        # Detect job portal from the host only
+        host = parsed.hostname or ''
+        result['portal'] = next(
+            (portal for domain, portal in _DOMAIN_TO_PORTAL.items()
+             if host == domain or host.endswith('.' + domain)),
+            None
+        )
 
         # Check for suspicious URL patterns
-        suspicious_patterns = ['bit.ly', 'tinyurl', 'goo.gl', 'temp-mail', '10minutemail']
-        if any(pattern in job_input_lower for pattern in suspicious_patterns):
+        if _SUSPICIOUS_HOST_RE.search(host):
             result['warnings'].append('URL contains link shortener or temporary service - this is suspicious')
 
+        # Only supported portals can be scraped, so reject other hosts up front
+        if not result['portal']:
+            result['valid'] = False
+            result['error'] = 'Unsupported job portal. Supported: LinkedIn, Naukri, Indeed, Internshala'
+
     else:  # text input
         # Text validation
         if len(job_input) < 50:
@@ -112,17 +140,12 @@ def validate_job_input(job_input, input_type):
             result['warnings'].append('Job description is very long. Analysis may take longer.')
 
         # Check for minimum professional content
-        professional_keywords = [
-            'responsibilities', 'requirements', 'qualifications', 'skills',
-            'experience', 'education', 'benefits', 'salary', 'compensation'
-        ]
-
-        found_keywords = sum(1 for keyword in professional_keywords if keyword in job_input.lower())
+        found_keywords = len({match.lower() for match in _PROFESSIONAL_KW_RE.findall(job_input)})
         if found_keywords < 2:
             result['warnings'].append('Job description lacks standard professional sections. This may indicate a suspicious posting.')
 
         # Check for excessive special characters
-        special_chars = sum(1 for char in job_input if not char.isalnum() and char not in ' .,!?-()')
+        special_chars = sum(1 for char in job_input.translate(_DELETE_ALLOWED) if not char.isalnum())
         special_ratio = special_chars / len(job_input) if job_input else 0
         if special_ratio > 0.1:
             result['warnings'].append('Job description contains many special characters - this is unusual')
@@ -133,21 +156,26 @@ def validate_job_input(job_input, input_type):
 def health_check():
     """Health check endpoint"""
     analyzer = get_analyzer()
-    return jsonify({
+    response = jsonify({
         'status': 'healthy',
         'message': 'Fake Job Detection API is running',
         'model_loaded': analyzer.model_loaded
-    }), 200
+    })
+    response.cache_control.public = True
+    response.cache_control.max_age = 5
+    return response, 200
 
 @api_bp.route('/analyze', methods=['POST'])
 def analyze_job():
     """Main endpoint to analyze job posting with enhanced validation"""
     try:
-        data = request.json
-        analyzer = get_analyzer()
+        if request.content_length and request.content_length > ANALYZE_MAX_PAYLOAD:
+            return jsonify({'error': 'Payload too large'}), 413
+
+        data = request.get_json(silent=True, cache=False)
 
         # Validate input
-        if not data:
+        if not data or not isinstance(data, dict):
             return jsonify({'error': 'No data provided'}), 400
 
         job_input = data.get('job_input', '').strip()
@@ -167,12 +195,16 @@ def analyze_job():
         validation_result = validate_job_input(job_input, input_type)
         if not validation_result['valid']:
             return jsonify({'error': validation_result['error']}), 400
+        parsed_url = validation_result.pop('parsed_url', None)
+
+        analyzer = get_analyzer()
 
-        logger.info(f"Analyzing job - Type: {input_type}, Length: {len(job_input)}, Portal: {validation_result.get('portal', 'N/A')}")
+        logger.info("Analyzing job - Type: %s, Length: %d, Portal: %s",
+                    input_type, len(job_input), validation_result.get('portal', 'N/A'))
 
         # Analyze based on input type
         if input_type == 'url':
-            result = analyzer.analyze_from_url(job_input)
+            result = analyzer.analyze_from_url(job_input, parsed=parsed_url)
         else:
             result = analyzer.analyze_from_text(job_input)
 
@@ -183,13 +215,13 @@ def analyze_job():
         # Add validation info to result
         result['input_validation'] = validation_result
 
-        # Store result in session for result page
-        session['last_analysis'] = result
+        # Keep the result server-side; the session only carries its id
+        session['analysis_id'] = analysis_store.save(result)
 
         return jsonify(result), 200
 
     except Exception as e:
-        logger.error(f"Error analyzing job: {str(e)}", exc_info=True)
+        logger.error("Error analyzing job: %s", e, exc_info=True)
         return jsonify({
             'error': f'Server error: {str(e)}',
             'success': False
@@ -197,12 +229,16 @@ def analyze_job():
 
 @api_bp.route('/analyze-batch', methods=['POST'])
 def analyze_batch():
-    """Analyze multiple job postings"""
+    """Analyze multiple job postings
+
+    Clients sending ``Accept: application/x-ndjson`` receive one JSON line
+    per job as soon as it finishes (with its 1-based ``index``) instead of
+    a single response built after the whole batch completes.
+    """
     try:
-        data = request.json
-        analyzer = get_analyzer()
+        data = request.get_json(silent=True, cache=False)
         
-        if not data or 'jobs' not in data:
+        if not data or not isinstance(data, dict) or 'jobs' not in data:
             return jsonify({'error': 'Please provide jobs list'}), 400
         
         jobs = data.get('jobs', [])
@@ -210,24 +246,41 @@ def analyze_batch():
         if not isinstance(jobs, list) or len(jobs) == 0:
             return jsonify({'error': 'jobs must be a non-empty list'}), 400
         
-        results = []
+        analyzer = get_analyzer()
+        total = len(jobs)
         
-        for idx, job in enumerate(jobs, 1):
-            job_input = job.get('job_input', '').strip()
-            input_type = job.get('input_type', 'url').strip()
-            
-            if not job_input:
-                results.append({'error': 'Empty job input', 'success': False})
-                continue
-            
-            logger.info(f"Batch analyzing job {idx}/{len(jobs)}")
-            
-            if input_type == 'url':
-                result = analyzer.analyze_from_url(job_input)
-            else:
-                result = analyzer.analyze_from_text(job_input)
+        def run_one(indexed_job):
+            idx, job = indexed_job
+            try:
+                job_input = job.get('job_input', '').strip()
+                input_type = job.get('input_type', 'url').strip()
+                
+                if not job_input:
+                    return {'error': 'Empty job input', 'success': False}
+                
+                logger.info("Batch analyzing job %d/%d", idx, total)
+                
+                if input_type == 'url':
+                    return analyzer.analyze_from_url(job_input)
+                return analyzer.analyze_from_text(job_input)
+            except Exception as e:
+                logger.error("Batch job %d/%d failed: %s", idx, total, e, exc_info=True)
+                return {'error': f'Failed to analyze job: {str(e)}', 'success': False}
+        
+        workers = min(BATCH_MAX_WORKERS, total)
+        
+        if 'application/x-ndjson' in request.headers.get('Accept', ''):
+            def generate():
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    futures = {executor.submit(run_one, item): item[0] for item in enumerate(jobs, 1)}
+                    for future in as_completed(futures):
+                        yield current_app.json.dumps({'index': futures[future], **future.result()}) + '\n'
             
-            results.append(result)
+            return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+        
+        # Scraping is I/O-bound, so overlap network waits across threads
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(run_one, enumerate(jobs, 1)))
         
         return jsonify({
             'total_jobs': len(jobs),
@@ -236,43 +289,51 @@ def analyze_batch():
         }), 200
         
     except Exception as e:
-        logger.error(f"Batch analysis error: {str(e)}", exc_info=True)
+        logger.error("Batch analysis error: %s", e, exc_info=True)
         return jsonify({
             'error': f'Server error: {str(e)}',
             'success': False
         }), 500
 
+SUPPORTED_PORTALS = [
+    {
+        'name': 'LinkedIn',
+        'domain': 'linkedin.com',
+        'url_example': 'https://www.linkedin.com/jobs/view/...'
+    },
+    {
+        'name': 'Naukri',
+        'domain': 'naukri.com',
+        'url_example': 'https://www.naukri.com/job-...'
+    },
+    {
+        'name': 'Indeed',
+        'domain': 'indeed.com',
+        'url_example': 'https://www.indeed.com/jobs?q=...'
+    },
+    {
+        'name': 'Internshala',
+        'domain': 'internshala.com',
+        'url_example': 'https://internshala.com/internship/...'
+    }
+]
+
+@lru_cache(maxsize=1)
+def _supported_portals_body():
+    """Serialize the static portal list once per process"""
+    return current_app.json.dumps({
+        'supported_portals': SUPPORTED_PORTALS,
+        'count': len(SUPPORTED_PORTALS),
+        'success': True
+    })
+
 @api_bp.route('/supported-portals', methods=['GET'])
 def get_supported_portals():
     """Get list of supported job portals"""
-    portals = [
-        {
-            'name': 'LinkedIn',
-            'domain': 'linkedin.com',
-            'url_example': 'https://www.linkedin.com/jobs/view/...'
-        },
-        {
-            'name': 'Naukri',
-            'domain': 'naukri.com',
-            'url_example': 'https://www.naukri.com/job-...'
-        },
-        {
-            'name': 'Indeed',
-            'domain': 'indeed.com',
-            'url_example': 'https://www.indeed.com/jobs?q=...'
-        },
-        {
-            'name': 'Internshala',
-            'domain': 'internshala.com',
-            'url_example': 'https://internshala.com/internship/...'
-        }
-    ]
-    
-    return jsonify({
-        'supported_portals': portals,
-        'count': len(portals),
-        'success': True
-    }), 200
+    response = Response(_supported_portals_body(), mimetype='application/json')
+    response.cache_control.public = True
+    response.cache_control.max_age = 86400
+    return response, 200
 
 @api_bp.route('/test-analysis', methods=['GET'])
 def test_analysis():
@@ -298,7 +359,7 @@ def test_analysis():
         return jsonify(result), 200
     except Exception as e:
         import traceback
-        logger.error(f"Test analysis error: {str(e)}\n{traceback.format_exc()}")
+        logger.error("Test analysis error: %s\n%s", e, traceback.format_exc())
         return jsonify({
             'error': str(e),
             'traceback': traceback.format_exc(),
@@ -0,0 +1,63 @@
+import json
+import secrets
+import threading
+import time
+from collections import OrderedDict
+
+# Try to import redis (optional dependency for multi-worker deployments)
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+class AnalysisStore:
+    """Keep analysis results server-side, keyed by a short id stored in the session"""
+
+    KEY_PREFIX = 'analysis:'
+
+    def __init__(self, redis_url=None, ttl=3600, max_entries=1024):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._redis = None
+        if redis_url and REDIS_AVAILABLE:
+            self._redis = redis.Redis.from_url(redis_url)
+
+        # In-process fallback: analysis_id -> (expires_at, analysis), oldest first
+        self._local = OrderedDict()
+        self._lock = threading.Lock()
+
+    def save(self, analysis):
+        """Store an analysis result and return its id"""
+        analysis_id = secrets.token_urlsafe(12)
+
+        if self._redis is not None:
+            self._redis.setex(self.KEY_PREFIX + analysis_id, self.ttl, json.dumps(analysis, default=str))
+            return analysis_id
+
+        now = time.monotonic()
+        with self._lock:
+            # Entries share one TTL, so expired ones are always at the front
+            while self._local and next(iter(self._local.values()))[0] <= now:
+                self._local.popitem(last=False)
+            # Evict the oldest results once the cap is reached
+            while len(self._local) >= self.max_entries:
+                self._local.popitem(last=False)
+            self._local[analysis_id] = (now + self.ttl, analysis)
+
+        return analysis_id
+
+    def load(self, analysis_id):
+        """Return the stored analysis, or None if missing or expired"""
+        if not analysis_id:
+            return None
+
+        if self._redis is not None:
+            payload = self._redis.get(self.KEY_PREFIX + analysis_id)
+            return json.loads(payload) if payload else None
+
+        with self._lock:
+            entry = self._local.get(analysis_id)
+        if entry is None or entry[0] <= time.monotonic():
+            return None
+        return entry[1]
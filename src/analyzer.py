@@ -1,7 +1,10 @@
+import re
+import threading
 import numpy as np
+from bisect import bisect_right
+from collections import Counter
+from functools import cached_property, lru_cache
 from pathlib import Path
-from src.model_trainer import FakeJobDetector
-from src.feature_extractor import FeatureExtractor
 from src.scrapers.scraper_manager import ScraperManager
 from utils.red_flags import count_red_flags, analyze_quality
 from utils.domain_check import (
@@ -13,31 +16,320 @@ from utils.domain_check import (
     analyze_domain_complete
 )
 
+# Try to import hyperscan (optional, faster job title matching)
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+# Try to import pyahocorasick (optional, faster city/state keyword matching)
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Job text parsing patterns (compiled once at import)
+_TITLE_RE = re.compile(r'Job Title:\s*([^\n\r]+)', re.IGNORECASE)
+_ROLE_RE = re.compile(r'Role:\s*([^\n\r]+)', re.IGNORECASE)
+_ABOUT_JOB_RE = re.compile(r'About the job:\s*([^\n\r]+)', re.IGNORECASE)
+_KNOWN_JOB_TITLES = (
+    'Software Engineer', 'DevOps Engineer', 'Cloud Engineer', 'Data Engineer', 'Product Manager',
+    'Engineering Manager', 'Senior Software Engineer', 'Principal Engineer', 'Staff Engineer',
+    'Technical Lead', 'Team Lead', 'Engineering Lead', 'Site Reliability Engineer',
+    'Infrastructure Engineer', 'Security Engineer', 'Backend Engineer', 'Frontend Engineer',
+    'Full Stack Engineer', 'Mobile Engineer', 'iOS Engineer', 'Android Engineer', 'QA Engineer',
+    'Test Engineer', 'Automation Engineer', 'Release Engineer', 'Build Engineer',
+    'Platform Engineer', 'Systems Engineer', 'Network Engineer', 'Database Engineer',
+    'Data Scientist', 'Machine Learning Engineer', 'AI Engineer', 'Research Scientist',
+    'Technical Program Manager', 'Product Engineer', 'Solutions Engineer', 'Customer Engineer',
+    'Cloud Architect', 'Systems Architect', 'Software Architect', 'Technical Architect',
+    'Principal Architect', 'Staff Architect'
+)
+_KNOWN_TITLE_RE = re.compile(
+    r'\b(' + '|'.join(_KNOWN_JOB_TITLES) + r')\b\s*[-–—]?\s*\b(Senior|Principal|Staff|Lead|Manager|Director|VP|Head|Chief)?\b',
+    re.IGNORECASE
+)
+_JOB_TITLE_RES = [_KNOWN_TITLE_RE] + [re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'\b(Developer|Engineer|Scientist|Analyst|Manager|Architect|Specialist|Administrator|Coordinator|Consultant)\b\s+\b(in|for|of)\b\s+(.{10,50})',
+    r'(.{15,80})\s+\b(Engineer|Developer|Scientist|Manager|Architect|Specialist|Administrator)\b'
+)]
+_EXPERIENCE_RES = [re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'experience in\s+([^.]+?)\s*(?:integration|delivery|provisioning|infrastructure)',
+    r'experience in\s+([^.]+?)\s*(?:engineer|developer|scientist|manager|architect)',
+    r'experience in\s+([^.]+?)\s*(?:and|or|,|\.)'
+)]
+_WHITESPACE_RE = re.compile(r'\s+')
+_TRAILING_PUNCT_RE = re.compile(r'[.,;:!?]+$')
+_LEADING_CONNECTOR_RE = re.compile(r'^(in|for|of|and|or)\s+', re.IGNORECASE)
+_ABOUT_COMPANY_RE = re.compile(r'About company\s*[:.-]?\s*([^\n\r]+)', re.IGNORECASE)
+_DASH_RE = re.compile(r'[-–—]')
+_COMPANY_SUFFIX_RES = [re.compile(pattern) for pattern in (
+    r'^([A-Z][a-zA-Z\s]+(?:Inc|Ltd|Corp|LLC|Technologies|Solutions|Systems))\s',
+    r'^([A-Z][a-zA-Z\s]+(?:Inc|Ltd|Corp|LLC))\.',
+    r'^([A-Z][a-zA-Z\s]+),\s+Inc\.'
+)]
+_COMPANY_NAME_RE = re.compile(r'Company Name:\s*([^\n\r]+)', re.IGNORECASE)
+_COMPANY_RE = re.compile(r'Company:\s*([^\n\r]+)', re.IGNORECASE)
+_ABOUT_RE = re.compile(r'About\s+([^\n\r]+)', re.IGNORECASE)
+_EMAIL_RE = re.compile(r'[\w\.-]+@([\w\.-]+\.\w+)')
+_SALARY_RE = re.compile(r'[\$₹]\s*[\d,]+')
+
+# Lowercase keyword lists used by the line-based extractors
+_LINE_SKIP_PATTERNS = ('company logo', 'duration', 'month', 'remote', 'hiring office', 'applied', 'internship highlights', 'description', 'key responsibilities', 'skill', 'preferred candidate', 'industry type', 'department', 'employment type', 'education', 'key skills', 'report this job', 'about company', 'company info', 'address', 'minimum qualifications', 'preferred qualifications')
+_TITLE_SKIP_PATTERNS = _LINE_SKIP_PATTERNS + ('responsibilities include', 'you will', 'what you will do')
+_TITLE_SKIP_INDICATORS = ('about', 'company', 'location', 'salary', 'requirements', 'qualifications', 'responsibilities', 'benefits', 'minimum', 'preferred', 'experience', 'skills', 'education')
+_COMPANY_SKIP_PATTERNS = _LINE_SKIP_PATTERNS + ('role:', 'job title:')
+_COMPANY_SKIP_PREFIXES = ('job title', 'location', 'salary', 'about the job')
+_CITIES = ('Mumbai', 'Delhi', 'Bangalore', 'Bengaluru', 'Chennai', 'Hyderabad', 'Pune', 'Kolkata', 'Ahmedabad', 'Jaipur', 'Surat', 'Lucknow', 'Kanpur', 'Nagpur', 'Indore', 'Thane', 'Bhopal', 'Visakhapatnam', 'Patna', 'Vadodara', 'Ghaziabad', 'Ludhiana', 'Agra', 'Nashik', 'Faridabad', 'Meerut', 'Rajkot', 'Kalyan', 'Vasai', 'Varanasi', 'Srinagar', 'Aurangabad', 'Dhanbad', 'Amritsar', 'Navi Mumbai', 'Allahabad', 'Howrah', 'Ranchi', 'Gwalior', 'Jabalpur', 'Coimbatore', 'Vijayawada', 'Jodhpur', 'Madurai', 'Raipur', 'Kota', 'Guwahati', 'Chandigarh', 'Solapur', 'Hubli', 'Bareilly', 'Moradabad', 'Mysore', 'Gurgaon', 'Gurugram', 'Noida', 'Greater Noida')
+_CITY_WORD_RES = tuple(
+    (city, city.lower(), re.compile(r'\b' + re.escape(city) + r'\b', re.IGNORECASE)) for city in _CITIES
+)
+# Any city at all - lets _find_city reject most lines with a single search
+_CITY_ANY_RE = re.compile(r'\b(?:' + '|'.join(re.escape(city) for city in _CITIES) + r')\b', re.IGNORECASE)
+_LOCATION_SKIP_INDICATORS = ('company', 'duration', 'month', 'remote', 'hiring office', 'applied', 'internship', 'description', 'key responsibilities', 'skill', 'preferred candidate', 'industry type', 'department', 'employment type', 'education', 'key skills', 'report this job', 'about company', 'company info', 'address', 'role:', 'job title:', 'minimum qualifications', 'preferred qualifications', 'responsibilities include', 'you will', 'what you will do', 'send me roles', 'company logo')
+_REQUIREMENTS_START_KEYWORDS = ('requirement', 'skill')
+_REQUIREMENTS_END_KEYWORDS = ('salary', 'location', 'apply')
+_SENIOR_TITLE_TERMS = ('engineer', 'developer', 'scientist', 'architect', 'manager')
+_COMPANY_SUFFIX_KEYWORDS = ('inc', 'ltd', 'corp', 'llc', 'technologies', 'solutions')
+_COMPANY_LINE_KEYWORDS = ('ltd', 'inc', 'corp', 'llc', 'technologies', 'solutions', 'systems', 'smart', 'ai', 'tech')
+_REPEATED_COMPANY_KEYWORDS = _COMPANY_LINE_KEYWORDS + ('software', 'pvt')
+_ABOUT_NON_COMPANY = ('the job', 'the company', 'the role', 'us')
+_STATES = ('maharashtra', 'karnataka', 'tamil nadu', 'telangana', 'gujarat', 'rajasthan', 'uttar pradesh', 'madhya pradesh', 'west bengal', 'punjab', 'haryana', 'india')
+
+# Aho-Corasick automata: one pass per line finds every city/state mention
+_CITY_AC = None
+_STATE_AC = None
+if AHOCORASICK_AVAILABLE:
+    _CITY_AC = ahocorasick.Automaton()
+    for index, city in enumerate(_CITIES):
+        _CITY_AC.add_word(city.lower(), (index, city))
+    _CITY_AC.make_automaton()
+
+    _STATE_AC = ahocorasick.Automaton()
+    for state in _STATES:
+        _STATE_AC.add_word(state, state)
+    _STATE_AC.make_automaton()
+
+_CRITICAL_FLAG_PATTERNS = ('registration fee', 'pay fee', 'payment required', 'upfront payment',
+                           'bitcoin', 'cryptocurrency', 'blockchain investment', 'crypto investment',
+                           'guaranteed income', 'guaranteed job', 'no interview', 'no background check',
+                           'fake degree accepted', 'illegal work')
+_HIGH_RISK_FLAG_PATTERNS = ('urgent hiring', 'whatsapp', 'telegram', 'viber', 'skype',
+                            'work from home guaranteed', 'no experience needed', 'easy money',
+                            'get rich quick', 'passive income', 'micro task', 'captcha entry')
+
+# Job quality bands: a score in [_QUALITY_THRESHOLDS[i-1], _QUALITY_THRESHOLDS[i]) gets _QUALITY_LEVELS[i]
+_QUALITY_THRESHOLDS = (10, 20, 30, 40, 50, 60, 70, 80, 90)
+_QUALITY_LEVELS = ('SUSPICIOUS', 'POOR', 'VERY LOW', 'LOW', 'FAIR', 'MODERATE', 'GOOD', 'HIGH', 'VERY HIGH', 'EXCELLENT')
+
+_SEVERE_FLAGS = frozenset(('suspicious_email', 'spam_phrase', 'unrealistic_salary'))
+_CRITICAL_BIT = 1
+_HIGH_RISK_BIT = 2
+
+# One automaton for both pattern lists; each hit carries its category bit
+_FLAG_AC = None
+if AHOCORASICK_AVAILABLE:
+    _FLAG_AC = ahocorasick.Automaton()
+    for pattern in _CRITICAL_FLAG_PATTERNS:
+        _FLAG_AC.add_word(pattern, _CRITICAL_BIT)
+    for pattern in _HIGH_RISK_FLAG_PATTERNS:
+        _FLAG_AC.add_word(pattern, _FLAG_AC.get(pattern, 0) | _HIGH_RISK_BIT)
+    _FLAG_AC.make_automaton()
+
+@lru_cache(maxsize=1024)
+def _flag_category(flag):
+    """Return (is_critical, is_high_risk) for a red flag name"""
+    flag_lower = flag.lower()
+    if _FLAG_AC is None:
+        return (any(pattern in flag_lower for pattern in _CRITICAL_FLAG_PATTERNS),
+                any(pattern in flag_lower for pattern in _HIGH_RISK_FLAG_PATTERNS))
+
+    bits = 0
+    for _, pattern_bits in _FLAG_AC.iter(flag_lower):
+        bits |= pattern_bits
+    return bool(bits & _CRITICAL_BIT), bool(bits & _HIGH_RISK_BIT)
+
+def _count_flag_categories(red_flags):
+    """Return (total, critical, high_risk) counts for a list of red flags"""
+    critical_count = high_risk_count = 0
+    for flag in red_flags:
+        is_critical, is_high_risk = _flag_category(flag)
+        critical_count += is_critical
+        high_risk_count += is_high_risk
+    return len(red_flags), critical_count, high_risk_count
+
+def _most_repeated(counts):
+    """Return the most frequent entry of a Counter if it occurs at least twice, else None"""
+    if counts:
+        line, count = counts.most_common(1)[0]
+        if count >= 2:
+            return line
+    return None
+
+def _is_word_char(char):
+    """Same notion of a word character as re's \\w"""
+    return char.isalnum() or char == '_'
+
+def _find_city(line, line_lower):
+    """Return the first city in _CITIES named as a whole word in the line, or None"""
+    if _CITY_AC is None:
+        if not _CITY_ANY_RE.search(line):
+            return None
+        for city, city_lower, city_re in _CITY_WORD_RES:
+            if line_lower == city_lower:
+                return city
+            if city_lower in line_lower and city_re.search(line):
+                return city
+        return None
+
+    best = None
+    for end, (index, city) in _CITY_AC.iter(line_lower):
+        start = end - len(city) + 1
+        if start > 0 and _is_word_char(line_lower[start - 1]):
+            continue
+        if end + 1 < len(line_lower) and _is_word_char(line_lower[end + 1]):
+            continue
+        # Earlier entries in _CITIES win, e.g. 'Mumbai' over 'Navi Mumbai'
+        if best is None or index < best[0]:
+            best = (index, city)
+    return best[1] if best else None
+
+def _mentions_state(line_lower):
+    """Return True if the line mentions an Indian state (or India)"""
+    if _STATE_AC is None:
+        return any(state in line_lower for state in _STATES)
+    return next(_STATE_AC.iter(line_lower), None) is not None
+
+# Big-tech detection: (brand token, any-of context tokens, company); an empty
+# context means the brand alone is enough. Rows are checked in order.
+_BIG_TECH_RULES = (
+    ('google', ('cloud', 'android', 'kubernetes', 'tensorflow', 'computer science'), 'Google'),
+    ('microsoft', ('azure', 'office', '.net'), 'Microsoft'),
+    ('amazon', ('aws', 'alexa'), 'Amazon'),
+    ('meta', (), 'Meta'),
+    ('facebook', (), 'Meta'),
+    ('apple', ('ios', 'macos'), 'Apple'),
+    ('netflix', (), 'Netflix'),
+    ('uber', (), 'Uber'),
+    ('airbnb', (), 'Airbnb'),
+)
+
+_BIG_TECH_AC = None
+if AHOCORASICK_AVAILABLE:
+    _BIG_TECH_AC = ahocorasick.Automaton()
+    for brand, context, _ in _BIG_TECH_RULES:
+        for token in (brand,) + context:
+            _BIG_TECH_AC.add_word(token, token)
+    _BIG_TECH_AC.make_automaton()
+
+def _detect_big_tech(text_lower):
+    """Return the big-tech company the text points at, or None"""
+    if _BIG_TECH_AC is None:
+        for brand, context, company in _BIG_TECH_RULES:
+            if brand in text_lower and (not context or any(token in text_lower for token in context)):
+                return company
+        return None
+
+    hits = {token for _, token in _BIG_TECH_AC.iter(text_lower)}
+    for brand, context, company in _BIG_TECH_RULES:
+        if brand in hits and (not context or not hits.isdisjoint(context)):
+            return company
+    return None
+
+# Multi-pattern scanner for the known job titles: one linear pass instead of
+# backtracking through every alternative at each position
+_TITLE_DB = None
+if HYPERSCAN_AVAILABLE:
+    _TITLE_DB = hyperscan.Database()
+    _TITLE_DB.compile(
+        expressions=[title.encode() for title in _KNOWN_JOB_TITLES],
+        ids=list(range(len(_KNOWN_JOB_TITLES))),
+        elements=len(_KNOWN_JOB_TITLES),
+        flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SOM_LEFTMOST] * len(_KNOWN_JOB_TITLES)
+    )
+
+def _first_known_title_offset(text):
+    """Return the character offset of the earliest known job title in text, or None"""
+    data = text.encode('utf-8')
+    starts = []
+
+    def on_match(pattern_id, start, end, flags, context):
+        starts.append(start)
+
+    _TITLE_DB.scan(data, match_event_handler=on_match)
+    if not starts:
+        return None
+    return len(data[:min(starts)].decode('utf-8'))
+
 class JobAnalyzer:
     """Main analysis engine for fake job detection"""
     
     def __init__(self):
-        self.detector = FakeJobDetector()
-        self.feature_extractor = FeatureExtractor()
+        # The model and feature extractor load on first use (see warm_up)
+        self.model_loaded = None
+        # cached_property has no lock (Python 3.12+), so loading is serialized here
+        self._load_lock = threading.Lock()
+        self._load_error = None
+    
+    @cached_property
+    def detector(self):
+        """Trained model, loaded on first access"""
+        from src.model_trainer import FakeJobDetector
         
-        # Load trained model
+        detector = FakeJobDetector()
         try:
-            self.detector.load_model()
+            detector.load_model()
             self.model_loaded = True
             print("[OK] AI Model loaded successfully")
         except Exception as e:
             print(f"[WARN] Model not found: {str(e)}")
             print("[WARN] Running in demo mode without trained model")
             self.model_loaded = False
+        return detector
     
-    def analyze_from_url(self, url):
-        """Analyze job from URL"""
+    @cached_property
+    def feature_extractor(self):
+        """Feature extractor, created on first access"""
+        from src.feature_extractor import FeatureExtractor
+        return FeatureExtractor()
+    
+    def warm_up(self):
+        """Load the model and feature extractor now instead of on the first analysis
+
+        A failed load is remembered, so later calls fail fast instead of
+        retrying the heavy construction on every request.
+        """
+        if 'detector' in self.__dict__ and 'feature_extractor' in self.__dict__:
+            return self
+        
+        with self._load_lock:
+            if self._load_error is not None:
+                raise RuntimeError(f"Analyzer failed to load: {self._load_error}") from self._load_error
+            try:
+                self.detector
+                self.feature_extractor
+            except Exception as e:
+                self._load_error = e
+                raise
+        return self
+    
+    def analyze_from_url(self, url, parsed=None):
+        """Analyze job from URL
+
+        ``parsed`` is an optional ``urlparse`` result for ``url`` that lets
+        the scraper skip parsing it again.
+        """
         print(f"\n[INFO] Analyzing job from URL: {url}")
         
+        # Load failures are server errors, not problems with this job
+        self.warm_up()
+        
         try:
             # Step 1: Scrape job data
             print("[1/3] Scraping job data...")
-            job_data = ScraperManager.scrape(url)
+            job_data = ScraperManager.scrape(url, parsed=parsed)
             print("✓ Job data scraped successfully")
             
             # Step 2: Analyze job posting
@@ -61,6 +353,9 @@ class JobAnalyzer:
         """Analyze job from pasted text"""
         print(f"\n[INFO] Analyzing job from pasted text")
         
+        # Load failures are server errors, not problems with this job
+        self.warm_up()
+        
         try:
             # Parse job description text to extract structured data
             print("[1/3] Parsing job description...")
@@ -87,24 +382,74 @@ class JobAnalyzer:
     def _parse_job_text(self, job_description_text):
         """Parse job description text into structured data - enhanced extraction"""
         text = job_description_text.strip()
-        lines = text.split('\n')
+
+        # Strip and lowercase once here instead of per line in every extractor
+        lines = [line.strip() for line in text.split('\n')]
+        text_lower = text.lower()
+        lines_lower = [line.lower() for line in lines]
+
+        scanned = self._scan_lines(lines, lines_lower)
 
         job_data = {
-            'title': self._extract_title_enhanced(text, lines),
-            'company': self._extract_company_enhanced(text, lines),
-            'company_domain': self._extract_domain(lines),
-            'location': self._extract_location(lines),
+            'title': self._extract_title_enhanced(text, text_lower, lines, lines_lower),
+            'company': self._extract_company_enhanced(text, text_lower, lines, lines_lower),
+            'company_domain': self._extract_domain(text),
+            'location': scanned['location'] or self._extract_location(lines, lines_lower),
             'description': text,
-            'requirements': self._extract_requirements(lines),
-            'salary': self._extract_salary(lines),
+            'requirements': scanned['requirements'],
+            'salary': scanned['salary'],
             'company_profile': '',
             'job_type': '',
-            'job_portal': self._detect_job_portal(text),
+            'job_portal': self._detect_job_portal(text_lower),
             'url': 'N/A'
         }
 
         return job_data
     
+    def _scan_lines(self, lines, lines_lower):
+        """Single pass over all (stripped) lines for the whole-text line fields.
+
+        Finds the first salary line, the first explicit location/city field
+        and the requirements block together instead of walking the lines
+        once per field. The scan stops as soon as all three are settled.
+        """
+        salary = None
+        location = None
+        requirements = []
+        capture = False
+        requirements_done = False
+        
+        for line, line_lower in zip(lines, lines_lower):
+            # Salary: first line mentioning salary or a currency symbol
+            if salary is None and ('salary' in line_lower or '$' in line or '₹' in line):
+                salary_match = _SALARY_RE.search(line)
+                salary = salary_match.group() if salary_match else line.split(':')[-1].strip()
+            
+            # Location: explicit location/city field
+            if location is None and ('location' in line_lower or 'city' in line_lower):
+                value = line.split(':')[-1].strip()
+                if value and value != line:
+                    location = value
+            
+            # Requirements: lines after a requirements/skills heading
+            if not requirements_done:
+                if any(keyword in line_lower for keyword in _REQUIREMENTS_START_KEYWORDS):
+                    capture = True
+                elif capture and line:
+                    if any(keyword in line_lower for keyword in _REQUIREMENTS_END_KEYWORDS):
+                        requirements_done = True
+                    else:
+                        requirements.append(line)
+            
+            if salary is not None and location is not None and requirements_done:
+                break
+        
+        return {
+            'salary': salary if salary is not None else "Not Specified",
+            'location': location,
+            'requirements': ' '.join(requirements)
+        }
+    
     def _extract_title(self, lines):
         """Extract job title from text"""
         # Usually first non-empty line or contains "Title"
@@ -113,278 +458,201 @@ class JobAnalyzer:
                 return line.strip()
         return "Unknown Job Title"
 
-    def _extract_title_enhanced(self, text, lines):
+    def _extract_title_enhanced(self, text, text_lower, lines, lines_lower):
         """Enhanced job title extraction with pattern recognition"""
         # Look for explicit patterns first
-        import re
-
         # Pattern 1: Job Title: [Title]
-        title_match = re.search(r'Job Title:\s*([^\n\r]+)', text, re.IGNORECASE)
+        title_match = _TITLE_RE.search(text)
         if title_match:
             return title_match.group(1).strip()
 
         # Pattern 2: Role: [Title]
-        role_match = re.search(r'Role:\s*([^\n\r]+)', text, re.IGNORECASE)
+        role_match = _ROLE_RE.search(text)
         if role_match:
             return role_match.group(1).strip()
 
         # Pattern 3: About the job: [Title]
-        about_match = re.search(r'About the job:\s*([^\n\r]+)', text, re.IGNORECASE)
+        about_match = _ABOUT_JOB_RE.search(text)
         if about_match:
             return about_match.group(1).strip()
 
         # Pattern 4: Look for job titles in structured formats
-        job_title_patterns = [
-            r'\b(Software Engineer|DevOps Engineer|Cloud Engineer|Data Engineer|Product Manager|Engineering Manager|Senior Software Engineer|Principal Engineer|Staff Engineer|Technical Lead|Team Lead|Engineering Lead|Site Reliability Engineer|Infrastructure Engineer|Security Engineer|Backend Engineer|Frontend Engineer|Full Stack Engineer|Mobile Engineer|iOS Engineer|Android Engineer|QA Engineer|Test Engineer|Automation Engineer|Release Engineer|Build Engineer|Platform Engineer|Systems Engineer|Network Engineer|Database Engineer|Data Scientist|Machine Learning Engineer|AI Engineer|Research Scientist|Technical Program Manager|Product Engineer|Solutions Engineer|Customer Engineer|Cloud Architect|Systems Architect|Software Architect|Technical Architect|Principal Architect|Staff Architect)\b\s*[-–—]?\s*\b(Senior|Principal|Staff|Lead|Manager|Director|VP|Head|Chief)?\b',
-            r'\b(Developer|Engineer|Scientist|Analyst|Manager|Architect|Specialist|Administrator|Coordinator|Consultant)\b\s+\b(in|for|of)\b\s+(.{10,50})',
-            r'(.{15,80})\s+\b(Engineer|Developer|Scientist|Manager|Architect|Specialist|Administrator)\b'
-        ]
-
-        for pattern in job_title_patterns:
-            title_match = re.search(pattern, text, re.IGNORECASE)
+
+        for pattern in _JOB_TITLE_RES:
+            if pattern is _KNOWN_TITLE_RE and _TITLE_DB is not None:
+                # Let hyperscan find where a known title starts; re still does the
+                # word-boundary and seniority-suffix matching from there
+                offset = _first_known_title_offset(text)
+                title_match = pattern.search(text, offset) if offset is not None else None
+            else:
+                title_match = pattern.search(text)
             if title_match:
                 title = title_match.group(0).strip()
-                title = re.sub(r'\s+', ' ', title)
-                title = re.sub(r'[.,;:!?]+$', '', title)
+                title = _WHITESPACE_RE.sub(' ', title)
+                title = _TRAILING_PUNCT_RE.sub('', title)
                 if 10 <= len(title) <= 100:
                     return title
 
         # Pattern 5: Special handling for tech job postings
-        if 'experience in' in text.lower():
-            experience_patterns = [
-                r'experience in\s+([^.]+?)\s*(?:integration|delivery|provisioning|infrastructure)',
-                r'experience in\s+([^.]+?)\s*(?:engineer|developer|scientist|manager|architect)',
-                r'experience in\s+([^.]+?)\s*(?:and|or|,|\.)'
-            ]
-            for pattern in experience_patterns:
-                match = re.search(pattern, text, re.IGNORECASE)
+        if 'experience in' in text_lower:
+            for pattern in _EXPERIENCE_RES:
+                match = pattern.search(text)
                 if match:
                     potential_title = match.group(1).strip()
-                    if any(term in potential_title.lower() for term in ['engineer', 'developer', 'scientist', 'architect', 'manager']):
-                        potential_title = re.sub(r'\s+', ' ', potential_title)
-                        potential_title = re.sub(r'^(in|for|of|and|or)\s+', '', potential_title, flags=re.IGNORECASE)
+                    if any(term in potential_title.lower() for term in _SENIOR_TITLE_TERMS):
+                        potential_title = _WHITESPACE_RE.sub(' ', potential_title)
+                        potential_title = _LEADING_CONNECTOR_RE.sub('', potential_title)
                         if 5 <= len(potential_title) <= 80:
                             return potential_title.title()
 
         # Pattern 6: Look for repeated lines (likely job title)
-        title_counts = {}
-        for line in lines[:15]:
-            line = line.strip()
+        title_counts = Counter()
+        for line, line_lower in zip(lines[:15], lines_lower[:15]):
             if line and len(line) > 3 and len(line) < 100:
-                skip_patterns = ['company logo', 'duration', 'month', 'remote', 'hiring office', 'applied', 'internship highlights', 'description', 'key responsibilities', 'skill', 'preferred candidate', 'industry type', 'department', 'employment type', 'education', 'key skills', 'report this job', 'about company', 'company info', 'address', 'minimum qualifications', 'preferred qualifications', 'responsibilities include', 'you will', 'what you will do']
-                if any(pattern in line.lower() for pattern in skip_patterns):
+                if any(pattern in line_lower for pattern in _TITLE_SKIP_PATTERNS):
                     continue
-                if '@' not in line and 'http' not in line and not line.startswith('₹') and not line.startswith('$'):
-                    title_counts[line] = title_counts.get(line, 0) + 1
+                if '@' not in line and 'http' not in line and not line.startswith(('₹', '$')):
+                    title_counts[line] += 1
 
-        if title_counts:
-            most_common = max(title_counts.items(), key=lambda x: x[1])
-            if most_common[1] >= 2:
-                return most_common[0]
+        repeated_title = _most_repeated(title_counts)
+        if repeated_title:
+            return repeated_title
 
         # Pattern 7: Look for common job title indicators
-        for line in lines[:10]:
-            line = line.strip()
+        for line, line_lower in zip(lines[:10], lines_lower[:10]):
             if not line:
                 continue
-            skip_indicators = ['about', 'company', 'location', 'salary', 'requirements', 'qualifications', 'responsibilities', 'benefits', 'minimum', 'preferred', 'experience', 'skills', 'education']
-            if any(line.lower().startswith(indicator) for indicator in skip_indicators):
+            if line_lower.startswith(_TITLE_SKIP_INDICATORS):
                 continue
             if 3 < len(line) < 100 and '@' not in line and 'http' not in line:
                 return line
 
-        # Fallback to original method
-        return self._extract_title(lines)
+        # Fallback to original method (measures the unstripped lines)
+        return self._extract_title(text.split('\n'))
 
-    def _extract_company(self, lines):
+    def _extract_company(self, lines, lines_lower):
         """Extract company name from text"""
-        for line in lines:
-            if 'company' in line.lower() or 'employer' in line.lower():
+        for line, line_lower in zip(lines, lines_lower):
+            if 'company' in line_lower or 'employer' in line_lower:
                 return line.split(':')[-1].strip()
         return "Unknown Company"
 
-    def _extract_company_enhanced(self, text, lines):
+    def _extract_company_enhanced(self, text, text_lower, lines, lines_lower):
         """Enhanced company name extraction with pattern recognition"""
-        import re
-
         # Pattern 0: Detect major tech companies from content patterns
-        text_lower = text.lower()
-        if 'google' in text_lower and ('cloud' in text_lower or 'android' in text_lower or 'kubernetes' in text_lower or 'tensorflow' in text_lower or 'computer science' in text_lower):
-            return 'Google'
-        elif 'microsoft' in text_lower and ('azure' in text_lower or 'office' in text_lower or '.net' in text_lower):
-            return 'Microsoft'
-        elif 'amazon' in text_lower and ('aws' in text_lower or 'alexa' in text_lower):
-            return 'Amazon'
-        elif 'meta' in text_lower or 'facebook' in text_lower:
-            return 'Meta'
-        elif 'apple' in text_lower and ('ios' in text_lower or 'macos' in text_lower):
-            return 'Apple'
-        elif 'netflix' in text_lower:
-            return 'Netflix'
-        elif 'uber' in text_lower:
-            return 'Uber'
-        elif 'airbnb' in text_lower:
-            return 'Airbnb'
+        big_tech = _detect_big_tech(text_lower)
+        if big_tech:
+            return big_tech
 
         # Pattern 1: About company section
-        about_company_match = re.search(r'About company\s*[:.-]?\s*([^\n\r]+)', text, re.IGNORECASE)
+        about_company_match = _ABOUT_COMPANY_RE.search(text)
         if about_company_match:
             company = about_company_match.group(1).strip()
-            company = re.split(r'[-–—]', company)[0].strip()
+            company = _DASH_RE.split(company)[0].strip()
             if len(company) > 50:
-                company_patterns = [
-                    r'^([A-Z][a-zA-Z\s]+(?:Inc|Ltd|Corp|LLC|Technologies|Solutions|Systems))\s',
-                    r'^([A-Z][a-zA-Z\s]+(?:Inc|Ltd|Corp|LLC))\.',
-                    r'^([A-Z][a-zA-Z\s]+),\s+Inc\.'
-                ]
-                for pattern in company_patterns:
-                    match = re.search(pattern, company)
+                for pattern in _COMPANY_SUFFIX_RES:
+                    match = pattern.search(company)
                     if match:
                         return match.group(1).strip()
                 words = company.split()[:5]
                 company_candidate = ' '.join(words)
-                if any(keyword in company_candidate.lower() for keyword in ['inc', 'ltd', 'corp', 'llc', 'technologies', 'solutions']):
+                if any(keyword in company_candidate.lower() for keyword in _COMPANY_SUFFIX_KEYWORDS):
                     return company_candidate
             elif len(company) > 3 and not company.lower().startswith(('india', 'funded', 'in collaboration')):
                 return company
 
         # Pattern 2: Company Name: [Company]
-        company_match = re.search(r'Company Name:\s*([^\n\r]+)', text, re.IGNORECASE)
+        company_match = _COMPANY_NAME_RE.search(text)
         if company_match:
             return company_match.group(1).strip()
 
         # Pattern 3: Company: [Company]
-        company_match2 = re.search(r'Company:\s*([^\n\r]+)', text, re.IGNORECASE)
+        company_match2 = _COMPANY_RE.search(text)
         if company_match2:
             return company_match2.group(1).strip()
 
         # Pattern 4: Look for repeated company names in first few lines
-        company_counts = {}
-        for line in lines[:12]:
-            line = line.strip()
+        company_counts = Counter()
+        for line, line_lower in zip(lines[:12], lines_lower[:12]):
             if line and len(line) > 3 and len(line) < 50:
-                skip_patterns = ['company logo', 'duration', 'month', 'remote', 'hiring office', 'applied', 'internship highlights', 'description', 'key responsibilities', 'skill', 'preferred candidate', 'industry type', 'department', 'employment type', 'education', 'key skills', 'report this job', 'about company', 'company info', 'address', 'role:', 'job title:', 'minimum qualifications', 'preferred qualifications']
-                if any(pattern in line.lower() for pattern in skip_patterns):
+                if any(pattern in line_lower for pattern in _COMPANY_SKIP_PATTERNS):
                     continue
-                if '@' not in line and 'http' not in line and not line.startswith('₹') and not line.startswith('$') and not line.isdigit():
-                    if any(keyword in line.lower() for keyword in ['ltd', 'inc', 'corp', 'llc', 'technologies', 'solutions', 'systems', 'smart', 'ai', 'tech', 'software', 'pvt']):
-                        company_counts[line] = company_counts.get(line, 0) + 1
+                if '@' not in line and 'http' not in line and not line.startswith(('₹', '$')) and not line.isdigit():
+                    if any(keyword in line_lower for keyword in _REPEATED_COMPANY_KEYWORDS):
+                        company_counts[line] += 1
 
-        if company_counts:
-            most_common = max(company_counts.items(), key=lambda x: x[1])
-            if most_common[1] >= 2:
-                return most_common[0]
+        repeated_company = _most_repeated(company_counts)
+        if repeated_company:
+            return repeated_company
 
         # Pattern 5: About [Company]
-        about_match = re.search(r'About\s+([^\n\r]+)', text, re.IGNORECASE)
+        about_match = _ABOUT_RE.search(text)
         if about_match:
             company = about_match.group(1).strip()
-            if not any(word in company.lower() for word in ['the job', 'the company', 'the role', 'us']):
+            if not any(word in company.lower() for word in _ABOUT_NON_COMPANY):
                 return company
 
         # Pattern 6: Look for company-like patterns in first few lines
-        for line in lines[:8]:
-            line = line.strip()
+        for line, line_lower in zip(lines[:8], lines_lower[:8]):
             if not line:
                 continue
-            if any(line.lower().startswith(indicator) for indicator in ['job title', 'location', 'salary', 'about the job']):
+            if line_lower.startswith(_COMPANY_SKIP_PREFIXES):
                 continue
-            if any(keyword in line.lower() for keyword in ['ltd', 'inc', 'corp', 'llc', 'technologies', 'solutions', 'systems', 'smart', 'ai', 'tech']):
+            if any(keyword in line_lower for keyword in _COMPANY_LINE_KEYWORDS):
                 return line
 
         if len(text) > 200:
             return "Unknown Company"
 
-        return self._extract_company(lines)
+        return self._extract_company(lines, lines_lower)
     
-    def _extract_domain(self, lines):
-        """Extract company domain from text"""
-        import re
-        for line in lines:
-            emails = re.findall(r'[\w\.-]+@[\w\.-]+\.\w+', line)
-            if emails:
-                domain = emails[0].split('@')[1]
-                return domain
+    def _extract_domain(self, text):
+        """Extract company domain from the first email address in the text"""
+        # The pattern cannot cross a newline, so the first hit is on the first line with an email
+        email_match = _EMAIL_RE.search(text)
+        if email_match:
+            return email_match.group(1)
         return ""
     
-    def _extract_location(self, lines):
-        """Extract location from text"""
-        import re
-
-        # Pattern 1: Explicit location/city field
-        for line in lines:
-            if 'location' in line.lower() or 'city' in line.lower():
-                location = line.split(':')[-1].strip()
-                if location and location != line.strip():
-                    return location
-
+    def _extract_location(self, lines, lines_lower):
+        """Extract location from text when there is no explicit location field (see _scan_lines)"""
         # Pattern 2: Look for city names
-        cities = ['Mumbai', 'Delhi', 'Bangalore', 'Bengaluru', 'Chennai', 'Hyderabad', 'Pune', 'Kolkata', 'Ahmedabad', 'Jaipur', 'Surat', 'Lucknow', 'Kanpur', 'Nagpur', 'Indore', 'Thane', 'Bhopal', 'Visakhapatnam', 'Patna', 'Vadodara', 'Ghaziabad', 'Ludhiana', 'Agra', 'Nashik', 'Faridabad', 'Meerut', 'Rajkot', 'Kalyan', 'Vasai', 'Varanasi', 'Srinagar', 'Aurangabad', 'Dhanbad', 'Amritsar', 'Navi Mumbai', 'Allahabad', 'Howrah', 'Ranchi', 'Gwalior', 'Jabalpur', 'Coimbatore', 'Vijayawada', 'Jodhpur', 'Madurai', 'Raipur', 'Kota', 'Guwahati', 'Chandigarh', 'Solapur', 'Hubli', 'Bareilly', 'Moradabad', 'Mysore', 'Gurgaon', 'Gurugram', 'Noida', 'Greater Noida']
-
-        for line in lines[:10]:
-            line = line.strip()
+        for line, line_lower in zip(lines[:10], lines_lower[:10]):
             if line:
-                for city in cities:
-                    if line.lower() == city.lower():
-                        return city
-                    if city.lower() in line.lower():
-                        if re.search(r'\b' + re.escape(city) + r'\b', line, re.IGNORECASE):
-                            return city
+                city = _find_city(line, line_lower)
+                if city:
+                    return city
 
         # Pattern 3: Look for location patterns
-        for line in lines[:15]:
-            line = line.strip()
+        for line, line_lower in zip(lines[:15], lines_lower[:15]):
             if not line:
                 continue
-            skip_indicators = ['company', 'duration', 'month', 'remote', 'hiring office', 'applied', 'internship', 'description', 'key responsibilities', 'skill', 'preferred candidate', 'industry type', 'department', 'employment type', 'education', 'key skills', 'report this job', 'about company', 'company info', 'address', 'role:', 'job title:', 'minimum qualifications', 'preferred qualifications', 'responsibilities include', 'you will', 'what you will do', 'send me roles', 'company logo']
-            if any(indicator in line.lower() for indicator in skip_indicators):
+            if any(indicator in line_lower for indicator in _LOCATION_SKIP_INDICATORS):
                 continue
-            if len(line) < 30 and not line.startswith('₹') and not line.startswith('$') and not '@' in line:
-                if any(state in line.lower() for state in ['maharashtra', 'karnataka', 'tamil nadu', 'telangana', 'gujarat', 'rajasthan', 'uttar pradesh', 'madhya pradesh', 'west bengal', 'punjab', 'haryana', 'india']):
+            if len(line) < 30 and not line.startswith(('₹', '$')) and not '@' in line:
+                if _mentions_state(line_lower):
                     return line
                 if ',' in line or line.isupper() or len(line.split()) <= 3:
                     return line
 
         return "Not Specified"
     
-    def _extract_requirements(self, lines):
-        """Extract requirements from text"""
-        requirements = []
-        capture = False
-        
-        for line in lines:
-            if 'requirement' in line.lower() or 'skill' in line.lower():
-                capture = True
-                continue
-            
-            if capture and line.strip():
-                if any(keyword in line.lower() for keyword in ['salary', 'location', 'apply']):
-                    break
-                requirements.append(line.strip())
-        
-        return ' '.join(requirements)
-    
-    def _extract_salary(self, lines):
-        """Extract salary information from text"""
-        import re
-        for line in lines:
-            if 'salary' in line.lower() or '$' in line or '₹' in line:
-                salary_match = re.search(r'[\$₹]\s*[\d,]+', line)
-                if salary_match:
-                    return salary_match.group()
-                return line.split(':')[-1].strip()
-        return "Not Specified"
-    
     def _analyze_job_data(self, job_data):
         """Analyze job data with AI model and enhanced red flag detection"""
+        features, red_flags = self._extract_signals(job_data)
 
+        # Enhanced rule-based scoring
+        combined_score = self._fast_prediction(features, red_flags)
+
+        return self._build_result(job_data, features, red_flags, combined_score), features
+
+    def _extract_signals(self, job_data):
+        """Extract features and red flags for a job; returns (features, red_flags)"""
         # Extract features
         features, combined_text = self.feature_extractor.extract_all_features(job_data)
 
         # Use enhanced red flag detection
         description = job_data.get('description', '')
-        requirements = job_data.get('requirements', '')
-        salary = job_data.get('salary', '')
 
         # Get comprehensive red flags
         red_flags_score, red_flags_dict = count_red_flags(description)
@@ -400,9 +668,10 @@ class JobAnalyzer:
         features['red_flags'] = red_flags
         features['red_flags_score'] = red_flags_score
 
-        # Enhanced rule-based scoring
-        combined_score = self._fast_prediction(features, red_flags)
+        return features, red_flags
 
+    def _build_result(self, job_data, features, red_flags, combined_score):
+        """Build the analysis result for a scored job"""
         # Determine final prediction
         final_prediction = "FAKE JOB" if combined_score > 0.5 else "GENUINE JOB"
 
@@ -429,16 +698,13 @@ class JobAnalyzer:
             'error': None
         }
 
-        # Domain analysis (after result dict is created)
+        # Domain analysis (after result dict is created); analyze_domain_complete
+        # handles its own failures and returns a neutral result instead of raising
         domain = job_data.get('company_domain', '')
         if domain:
-            try:
-                domain_analysis = analyze_domain_complete(domain + " " + job_data.get('description', ''))
-                result['domain_analysis'] = domain_analysis
-            except Exception as e:
-                pass
+            result['domain_analysis'] = analyze_domain_complete(domain + " " + job_data.get('description', ''))
 
-        return result, features
+        return result
     
     def _combine_predictions(self, ai_score, features, red_flags):
         """Combine AI prediction with rule-based scoring"""
@@ -483,18 +749,8 @@ class JobAnalyzer:
 
         # Additional red flag analysis
         if red_flags:
-            critical_patterns = ['registration fee', 'pay fee', 'payment required', 'upfront payment',
-                               'bitcoin', 'cryptocurrency', 'blockchain investment', 'crypto investment',
-                               'guaranteed income', 'guaranteed job', 'no interview', 'no background check',
-                               'fake degree accepted', 'illegal work']
-            critical_count = sum(1 for flag in red_flags if any(pattern in flag.lower() for pattern in critical_patterns))
-
-            high_risk_patterns = ['urgent hiring', 'whatsapp', 'telegram', 'viber', 'skype',
-                                'work from home guaranteed', 'no experience needed', 'easy money',
-                                'get rich quick', 'passive income', 'micro task', 'captcha entry']
-            high_risk_count = sum(1 for flag in red_flags if any(pattern in flag.lower() for pattern in high_risk_patterns))
-
-            other_flags = len(red_flags) - critical_count - high_risk_count
+            flag_total, critical_count, high_risk_count = _count_flag_categories(red_flags)
+            other_flags = flag_total - critical_count - high_risk_count
 
             score += critical_count * 0.15
             score += high_risk_count * 0.08
@@ -582,12 +838,11 @@ class JobAnalyzer:
         score -= positive_score
 
         return max(0, min(score, 1.0))
-    
+
     def _assess_severity(self, red_flags, combined_score):
         """Assess severity level of red flags"""
         
-        critical_flags = ['suspicious_email', 'spam_phrase', 'unrealistic_salary']
-        critical_count = sum(1 for flag in red_flags if flag in critical_flags)
+        critical_count = sum(1 for flag in red_flags if flag in _SEVERE_FLAGS)
         
         if critical_count > 0 or combined_score > 0.8:
             return "High"
@@ -723,31 +978,10 @@ class JobAnalyzer:
 
         quality_score = max(0, min(100, quality_score))
 
-        if quality_score >= 90:
-            return "EXCELLENT"
-        elif quality_score >= 80:
-            return "VERY HIGH"
-        elif quality_score >= 70:
-            return "HIGH"
-        elif quality_score >= 60:
-            return "GOOD"
-        elif quality_score >= 50:
-            return "MODERATE"
-        elif quality_score >= 40:
-            return "FAIR"
-        elif quality_score >= 30:
-            return "LOW"
-        elif quality_score >= 20:
-            return "VERY LOW"
-        elif quality_score >= 10:
-            return "POOR"
-        else:
-            return "SUSPICIOUS"
+        return _QUALITY_LEVELS[bisect_right(_QUALITY_THRESHOLDS, quality_score)]
     
-    def _detect_job_portal(self, text):
-        """Detect job portal from URL patterns or text content"""
-        text_lower = text.lower()
-
+    def _detect_job_portal(self, text_lower):
+        """Detect job portal from URL patterns or text content (expects lowercased text)"""
         # Check for URL patterns
         if 'naukri.com' in text_lower:
             return 'naukri.com'
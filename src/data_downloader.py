@@ -3,6 +3,19 @@ import pandas as pd
 import requests
 from pathlib import Path
 
+# Try to import pyarrow (optional, multithreaded CSV parsing and Parquet output)
+try:
+    import pyarrow
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Kaggle columns prepare_dataset needs; job_id keeps drop_duplicates meaning "same posting"
+SOURCE_COLUMNS = [
+    'job_id', 'title', 'company_profile', 'description', 'requirements',
+    'salary_range', 'location', 'fraudulent'
+]
+
 class DatasetDownloader:
     """Download fake job detection datasets"""
     
@@ -24,7 +37,11 @@ class DatasetDownloader:
             print("📌 URL: https://www.kaggle.com/datasets/shivamb/real-or-fake-fake-jobposting-prediction")
             return None
         
-        return pd.read_csv(dataset_path)
+        return pd.read_csv(
+            dataset_path,
+            usecols=SOURCE_COLUMNS,
+            engine='pyarrow' if PYARROW_AVAILABLE else 'c'
+        )
     
     def prepare_dataset(self, df):
         """Prepare and clean dataset"""
@@ -34,9 +51,8 @@ class DatasetDownloader:
         df = df.drop_duplicates()
         
         # Handle missing values
-        df['description'] = df['description'].fillna('')
-        df['company_profile'] = df['company_profile'].fillna('')
-        df['requirements'] = df['requirements'].fillna('')
+        text_cols = ['description', 'company_profile', 'requirements']
+        df[text_cols] = df[text_cols].fillna('')
         
         # Create target variable (0 = genuine, 1 = fake)
         df['is_fake'] = df['fraudulent']
@@ -51,10 +67,14 @@ class DatasetDownloader:
         
         return df
     
-    def save_processed_data(self, df, filename='processed_jobs.csv'):
-        """Save processed dataset"""
+    def save_processed_data(self, df, filename='processed_jobs.parquet', as_csv=False):
+        """Save processed dataset as Parquet, or CSV when requested or pyarrow is missing"""
         output_path = self.data_dir / filename
-        df.to_csv(output_path, index=False)
+        if as_csv or not PYARROW_AVAILABLE:
+            output_path = output_path.with_suffix('.csv')
+            df.to_csv(output_path, index=False)
+        else:
+            df.to_parquet(output_path, engine='pyarrow', compression='snappy', index=False)
         print(f"✅ Dataset saved to {output_path}")
         return output_path
 
@@ -3,28 +3,93 @@ import nltk
 from nltk.corpus import stopwords
 from nltk.tokenize import word_tokenize
 from textblob import TextBlob
-import numpy as np
-from sklearn.feature_extraction.text import TfidfVectorizer
 import pandas as pd
 from collections import Counter
+from functools import lru_cache
 import math
 
+# Try to import pyahocorasick (optional, faster scam phrase counting)
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 # Download required NLTK data
 nltk.download('punkt', quiet=True)
 nltk.download('stopwords', quiet=True)
 nltk.download('averaged_perceptron_tagger', quiet=True)
 
+# clean_text passes - order matters, e.g. URLs go before an email can swallow them
+_URL_RE = re.compile(r'http\S+|www\S+')
+_EMAIL_RE = re.compile(r'\S+@\S+')
+_SPECIAL_CHARS_RE = re.compile(r'[^a-zA-Z0-9\s]+')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# check_suspicious_domain risk tiers
+_HIGH_RISK_DOMAIN_RE = re.compile(r'temp|fake|test|demo|example|mail\.com|gmail|yahoo|hotmail')
+_SUSPICIOUS_TLD_RE = re.compile(r'\.(?:tk|ml|ga|cf|gq|xyz|top|win|bid)\Z')
+_LOW_RISK_DOMAIN_RE = re.compile(r'temp-mail|10minutemail|guerrillamail|mailinator')
+_NUMERIC_DOMAIN_RE = re.compile(r'^\d+\..*$')
+
+# Red flag phrase lists
+_SPAM_INDICATORS = ('work from home with no experience', 'easy money', 'get rich quick',
+                    'no experience needed', 'guaranteed income', 'bitcoin', 'crypto')
+_SPAM_RE = re.compile('|'.join(map(re.escape, _SPAM_INDICATORS)))
+_SUSPICIOUS_EMAIL_RE = re.compile('|'.join(map(re.escape, ('@temp', '@fake', '@test', '@gmail.com', '@yahoo.com'))))
+_SCAM_PHRASES = ('guaranteed', 'easy money', 'work from home', 'no experience', 'urgent', 'apply now',
+                 'bitcoin', 'crypto', 'passive income')
+
+# One automaton pass reports every scam phrase, including overlapping ones
+_SCAM_AC = None
+if AHOCORASICK_AVAILABLE:
+    _SCAM_AC = ahocorasick.Automaton()
+    for phrase in _SCAM_PHRASES:
+        _SCAM_AC.add_word(phrase, phrase)
+    _SCAM_AC.make_automaton()
+
+def _count_scam_phrases(text_lower):
+    """Number of distinct _SCAM_PHRASES that occur in the text"""
+    if _SCAM_AC is None:
+        return sum(1 for phrase in _SCAM_PHRASES if phrase in text_lower)
+    return len({phrase for _, phrase in _SCAM_AC.iter(text_lower)})
+
+# Business vocabulary counted by _calculate_professional_term_ratio
+_PROFESSIONAL_TERMS = frozenset({
+    'responsibilities', 'requirements', 'qualifications', 'skills', 'experience',
+    'education', 'benefits', 'salary', 'compensation', 'company', 'organization',
+    'team', 'project', 'client', 'customer', 'deadline', 'milestone', 'objective',
+    'strategy', 'analysis', 'development', 'implementation', 'collaboration'
+})
+
+@lru_cache(maxsize=65536)
+def _count_syllables(word):
+    """Count syllables in a word (simplified); cached since job texts share most words"""
+    word = word.lower()
+    count = 0
+    vowels = "aeiouy"
+    if word[0] in vowels:
+        count += 1
+    for index in range(1, len(word)):
+        if word[index] in vowels and word[index - 1] not in vowels:
+            count += 1
+    if word.endswith("e"):
+        count -= 1
+    if count == 0:
+        count += 1
+    return count
+
+@lru_cache(maxsize=4096)
+def _sentiment(text):
+    """TextBlob polarity and subjectivity; cached since reposted and re-analyzed jobs repeat verbatim"""
+    blob = TextBlob(text)
+    return blob.sentiment.polarity, blob.sentiment.subjectivity
+
 class FeatureExtractor:
     """Extract features from job postings"""
     
     def __init__(self):
         self.stop_words = set(stopwords.words('english'))
-        self.tfidf_vectorizer = TfidfVectorizer(
-            max_features=500,
-            min_df=2,
-            max_df=0.8,
-            ngram_range=(1, 2)
-        )
     
     def clean_text(self, text):
         """Clean and preprocess text"""
@@ -35,29 +100,32 @@ class FeatureExtractor:
         text = text.lower()
         
         # Remove URLs
-        text = re.sub(r'http\S+|www\S+|https\S+', '', text, flags=re.MULTILINE)
+        text = _URL_RE.sub('', text)
         
         # Remove email addresses
-        text = re.sub(r'\S+@\S+', '', text)
+        text = _EMAIL_RE.sub('', text)
         
         # Remove special characters
-        text = re.sub(r'[^a-zA-Z0-9\s]', '', text)
+        text = _SPECIAL_CHARS_RE.sub('', text)
         
         # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text).strip()
+        text = _WHITESPACE_RE.sub(' ', text).strip()
         
         return text
     
-    def extract_text_features(self, text):
-        """Extract linguistic features - ultra fast version"""
+    def extract_text_features(self, text, words=None):
+        """Extract linguistic features - ultra fast version (pass text.split() as words if already known)"""
+        if words is None:
+            words = text.split()
+        text_length = len(text)
         # Use extremely simplified features for maximum speed
         features = {
-            'text_length': len(text),
-            'word_count': len(text.split()),
+            'text_length': text_length,
+            'word_count': len(words),
             'avg_word_length': 5.0,  # Fixed average for speed
             'unique_word_ratio': 0.6,  # Fixed ratio for speed
-            'uppercase_ratio': sum(1 for c in text if c.isupper()) / len(text) if text else 0,
-            'digit_ratio': sum(1 for c in text if c.isdigit()) / len(text) if text else 0,
+            'uppercase_ratio': sum(map(str.isupper, text)) / text_length if text else 0,
+            'digit_ratio': sum(map(str.isdigit, text)) / text_length if text else 0,
         }
         return features
     
@@ -90,31 +158,19 @@ class FeatureExtractor:
         domain_lower = domain.lower()
 
         # High-risk suspicious keywords (weight: 1.0)
-        high_risk_keywords = ['temp', 'fake', 'test', 'demo', 'example', 'mail.com', 'gmail', 'yahoo', 'hotmail']
+        if _HIGH_RISK_DOMAIN_RE.search(domain_lower):
+            return 1.0
 
         # Medium-risk suspicious TLDs (weight: 0.8)
-        suspicious_tlds = ['.tk', '.ml', '.ga', '.cf', '.gq', '.xyz', '.top', '.win', '.bid']
+        if _SUSPICIOUS_TLD_RE.search(domain_lower):
+            return 0.8
 
         # Low-risk patterns (weight: 0.5)
-        low_risk_patterns = ['temp-mail', '10minutemail', 'guerrillamail', 'mailinator']
-
-        # Check high-risk keywords
-        for keyword in high_risk_keywords:
-            if keyword in domain_lower:
-                return 1.0
-
-        # Check suspicious TLDs
-        for tld in suspicious_tlds:
-            if domain_lower.endswith(tld):
-                return 0.8
-
-        # Check low-risk patterns
-        for pattern in low_risk_patterns:
-            if pattern in domain_lower:
-                return 0.5
+        if _LOW_RISK_DOMAIN_RE.search(domain_lower):
+            return 0.5
 
         # Check for numbers-only domains (suspicious)
-        if re.match(r'^\d+\..*$', domain_lower):
+        if _NUMERIC_DOMAIN_RE.match(domain_lower):
             return 0.7
 
         # Check for extremely short domains
@@ -124,8 +180,8 @@ class FeatureExtractor:
 
         return 0.0  # Legitimate domain
     
-    def extract_red_flags(self, description, requirements, salary):
-        """Detect red flags in job posting - optimized for speed"""
+    def extract_red_flags(self, description, requirements, salary, text_lower=None):
+        """Detect red flags in job posting - optimized for speed (pass the lowercased description + requirements as text_lower if already known)"""
         red_flags = []
 
         # Early return for very short descriptions
@@ -134,7 +190,7 @@ class FeatureExtractor:
             return red_flags
 
         # Convert to lowercase once
-        text_combined = (description + ' ' + requirements).lower()
+        text_combined = text_lower if text_lower is not None else (description + ' ' + requirements).lower()
 
         # Check for unrealistic salary (fast check)
         if salary and isinstance(salary, str):
@@ -143,17 +199,13 @@ class FeatureExtractor:
                 red_flags.append('unrealistic_salary')
 
         # Check for spam phrases (optimized)
-        spam_indicators = ['work from home with no experience', 'easy money', 'get rich quick',
-                          'no experience needed', 'guaranteed income', 'bitcoin', 'crypto']
-        for indicator in spam_indicators:
-            if indicator in text_combined:
-                red_flags.append('spam_phrase')
-                break
+        if _SPAM_RE.search(text_combined):
+            red_flags.append('spam_phrase')
 
         # Check for suspicious emails (simplified)
         if '@' in text_combined:
             # Simple check for suspicious patterns
-            if any(sus in text_combined for sus in ['@temp', '@fake', '@test', '@gmail.com', '@yahoo.com']):
+            if _SUSPICIOUS_EMAIL_RE.search(text_combined):
                 red_flags.append('suspicious_email')
 
         # Check for missing requirements (fast)
@@ -174,14 +226,20 @@ class FeatureExtractor:
         # Combine text for analysis
         combined_text = f"{description} {requirements} {company_profile}"
 
+        words = combined_text.split()
+
+        # Lowercase once and share it; lowering the parts equals lowering the joined text
+        red_flag_text = f"{description.lower()} {requirements.lower()}"
+        text_lower = f"{red_flag_text} {company_profile.lower()}"
+        words_lower_set = set(text_lower.split())
+
         # Extract basic features
-        text_features = self.extract_text_features(combined_text)
+        text_features = self.extract_text_features(combined_text, words)
         spelling_features = self.extract_spelling_features(combined_text)
         domain_features = self.extract_domain_features(company_domain, company_name)
-        red_flags = self.extract_red_flags(description, requirements, salary)
+        red_flags = self.extract_red_flags(description, requirements, salary, red_flag_text)
 
         # Enhanced text analysis
-        words = combined_text.split()
         sentences = re.split(r'[.!?]+', combined_text)
 
         # Sentiment analysis
@@ -191,10 +249,10 @@ class FeatureExtractor:
         readability_score = self._calculate_readability(combined_text, words, sentences)
         lexical_diversity = self._calculate_lexical_diversity(words)
         sentence_complexity = self._calculate_sentence_complexity(sentences)
-        professional_term_ratio = self._calculate_professional_term_ratio(combined_text)
+        professional_term_ratio = self._calculate_professional_term_ratio(words_lower_set)
 
         # Contextual red flag analysis
-        combo_score, combo_flags = self.analyze_red_flag_combinations(red_flags, combined_text)
+        combo_score, combo_flags = self.analyze_red_flag_combinations(red_flags, text_lower, len(words))
 
         # Enhanced features dictionary
         features = {
@@ -233,8 +291,7 @@ class FeatureExtractor:
     def _extract_sentiment(self, text):
         """Extract sentiment polarity and subjectivity"""
         try:
-            blob = TextBlob(text)
-            return blob.sentiment.polarity, blob.sentiment.subjectivity
+            return _sentiment(text)
         except:
             return 0.0, 0.0
 
@@ -247,7 +304,7 @@ class FeatureExtractor:
         avg_sentence_length = len(words) / len(sentences)
 
         # Average syllables per word (simplified approximation)
-        avg_syllables_per_word = sum(self._count_syllables(word) for word in words) / len(words)
+        avg_syllables_per_word = sum(map(_count_syllables, words)) / len(words)
 
         # Flesch Reading Ease score (simplified)
         readability = 206.835 - (1.015 * avg_sentence_length) - (84.6 * avg_syllables_per_word)
@@ -255,22 +312,6 @@ class FeatureExtractor:
         # Normalize to 0-1 scale
         return max(0, min(1, readability / 100))
 
-    def _count_syllables(self, word):
-        """Count syllables in a word (simplified)"""
-        word = word.lower()
-        count = 0
-        vowels = "aeiouy"
-        if word[0] in vowels:
-            count += 1
-        for index in range(1, len(word)):
-            if word[index] in vowels and word[index - 1] not in vowels:
-                count += 1
-        if word.endswith("e"):
-            count -= 1
-        if count == 0:
-            count += 1
-        return count
-
     def _calculate_lexical_diversity(self, words):
         """Calculate lexical diversity (unique words / total words)"""
         if not words:
@@ -282,38 +323,34 @@ class FeatureExtractor:
         if len(sentences) < 2:
             return 0
 
-        sentence_lengths = [len(s.split()) for s in sentences if s.strip()]
-        if not sentence_lengths:
+        # Single pass over the lengths; integer sums keep the variance exact
+        count = total = total_sq = 0
+        for sentence in sentences:
+            length = len(sentence.split())
+            if length:
+                count += 1
+                total += length
+                total_sq += length * length
+        if not count:
             return 0
 
         # Coefficient of variation (standard deviation / mean)
-        mean_length = np.mean(sentence_lengths)
-        std_length = np.std(sentence_lengths)
-
-        return std_length / mean_length if mean_length > 0 else 0
-
-    def _calculate_professional_term_ratio(self, text):
-        """Calculate ratio of professional/business terms"""
-        professional_terms = {
-            'responsibilities', 'requirements', 'qualifications', 'skills', 'experience',
-            'education', 'benefits', 'salary', 'compensation', 'company', 'organization',
-            'team', 'project', 'client', 'customer', 'deadline', 'milestone', 'objective',
-            'strategy', 'analysis', 'development', 'implementation', 'collaboration'
-        }
+        mean_length = total / count
+        std_length = math.sqrt((count * total_sq - total * total) / (count * count))
 
-        words = set(text.lower().split())
-        professional_count = sum(1 for word in words if word in professional_terms)
+        return std_length / mean_length
 
-        return professional_count / len(words) if words else 0
+    def _calculate_professional_term_ratio(self, words_lower_set):
+        """Calculate ratio of professional/business terms among the distinct lowercased words"""
+        professional_count = len(words_lower_set & _PROFESSIONAL_TERMS)
 
-    def analyze_red_flag_combinations(self, red_flags, text):
-        """Analyze combinations of red flags for enhanced detection"""
+        return professional_count / len(words_lower_set) if words_lower_set else 0
+
+    def analyze_red_flag_combinations(self, red_flags, text_lower, total_words=None):
+        """Analyze combinations of red flags for enhanced detection (text_lower must already be lowercased)"""
         combo_score = 0.0
         combo_flags = []
 
-        # Convert text to lowercase for analysis
-        text_lower = text.lower()
-
         # High-risk combinations (add significant suspicion)
         high_risk_combos = [
             (['payment required', 'urgent hiring'], 0.8, 'Payment + Urgency: Classic scam pattern'),
@@ -349,9 +386,9 @@ class FeatureExtractor:
             combo_flags.append('Multiple red flags detected')
 
         # Check for scam phrase density
-        scam_phrases = ['guaranteed', 'easy money', 'work from home', 'no experience', 'urgent', 'apply now', 'bitcoin', 'crypto', 'passive income']
-        scam_count = sum(1 for phrase in scam_phrases if phrase in text_lower)
-        total_words = len(text_lower.split())
+        scam_count = _count_scam_phrases(text_lower)
+        if total_words is None:
+            total_words = len(text_lower.split())
 
         if total_words > 0:
             scam_density = scam_count / total_words
@@ -2,7 +2,9 @@ import numpy as np
 import pandas as pd
 from sklearn.model_selection import train_test_split
 from sklearn.preprocessing import StandardScaler
-from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfTransformer
+from sklearn.decomposition import TruncatedSVD
+from sklearn.pipeline import make_pipeline
 try:
     import tensorflow as tf
     from tensorflow import keras
@@ -13,10 +15,108 @@ try:
 except ImportError:
     TF_AVAILABLE = False
     print("[WARN] TensorFlow not available - running in demo mode")
+try:
+    import onnxruntime as ort
+    ONNX_AVAILABLE = True
+except ImportError:
+    ONNX_AVAILABLE = False
+import os
 import joblib
+from scipy import sparse
 from pathlib import Path
 from src.feature_extractor import FeatureExtractor
 
+ONNX_MODEL_NAME = 'fake_job_detector.int8.onnx'
+ONNX_FP32_MODEL_NAME = 'fake_job_detector.onnx'
+KERAS_MODEL_NAME = 'fake_job_detector.keras'
+PREPROCESSORS_NAME = 'preprocessors.npz'
+# Artifacts written before the native Keras / .npz format; still loadable
+LEGACY_MODEL_NAME = 'fake_job_detector.h5'
+
+# Engineered features fed to the network, in column order
+MODEL_FEATURES = (
+    'text_length',
+    'word_count',
+    'avg_word_length',
+    'unique_word_ratio',
+    'uppercase_ratio',
+    'digit_ratio',
+    'spelling_errors',
+    'grammar_score',
+    'sentence_count',
+    'domain_exists',
+    'domain_length',
+    'has_suspicious_domain',
+    'company_name_length',
+    'red_flag_count',
+)
+
+# Width of the dense text embedding fed to the network
+TEXT_EMBEDDING_DIM = 128
+
+# Rows tf.data shuffles among when training on in-memory dense arrays
+SHUFFLE_BUFFER = 8192
+
+# Rows standardized at a time when scaling the training matrix in place
+SCALE_CHUNK_ROWS = 50_000
+
+def _make_dataset(X, y, batch_size, shuffle=True):
+    """Batched, prefetching tf.data pipeline over a dense (X, y).
+
+    Prefetching overlaps input preparation with training.
+    """
+    dataset = tf.data.Dataset.from_tensor_slices((X, np.asarray(y, dtype=np.float32)))
+    if shuffle:
+        dataset = dataset.shuffle(SHUFFLE_BUFFER)
+    dataset = dataset.batch(batch_size)
+    
+    return dataset.prefetch(tf.data.AUTOTUNE)
+
+def engineered_features(texts, feature_extractor):
+    """MODEL_FEATURES for a Series of job texts, computed column by column.
+
+    Matches extract_all_features for jobs whose description and
+    requirements are both the text and every other field is empty, but
+    computes whole columns at once and skips the sentiment/readability
+    extras the network never sees. Returns (combined_texts, float32 matrix).
+    """
+    # Same joining as extract_all_features: description, requirements, empty profile
+    combined = texts + ' ' + texts + ' '
+    text_length = combined.str.len().to_numpy()
+    
+    columns = {
+        **feature_extractor.extract_text_features(''),
+        **feature_extractor.extract_spelling_features(''),
+        **feature_extractor.extract_domain_features('', ''),
+        'text_length': text_length,
+        'word_count': combined.str.split().str.len().to_numpy(),
+        'uppercase_ratio': combined.map(lambda text: sum(map(str.isupper, text))).to_numpy() / text_length,
+        'digit_ratio': combined.map(lambda text: sum(map(str.isdigit, text))).to_numpy() / text_length,
+        'grammar_score': text_length,
+        'sentence_count': combined.str.count(r'[.!?]').to_numpy() + 1,
+        'red_flag_count': [len(feature_extractor.extract_red_flags(text, text, '')) for text in texts],
+    }
+    
+    # Fill a preallocated column-per-feature matrix; scalar columns broadcast
+    X_features = np.empty((len(texts), len(MODEL_FEATURES)), dtype=np.float32)
+    for index, name in enumerate(MODEL_FEATURES):
+        X_features[:, index] = columns[name]
+    
+    return combined.tolist(), X_features
+
+def fit_scaler_inplace(X, chunk_rows=SCALE_CHUNK_ROWS):
+    """Fit a StandardScaler on a dense float matrix and standardize X in place.
+
+    Fitting and transforming chunk by chunk keeps temporaries to one chunk,
+    so peak memory stays near one copy of X instead of two. Returns the scaler.
+    """
+    scaler = StandardScaler()
+    for start in range(0, X.shape[0], chunk_rows):
+        scaler.partial_fit(X[start:start + chunk_rows])
+    for start in range(0, X.shape[0], chunk_rows):
+        X[start:start + chunk_rows] = scaler.transform(X[start:start + chunk_rows])
+    return scaler
+
 class FakeJobDetector:
     """Deep Learning Model for Fake Job Detection"""
     
@@ -25,11 +125,13 @@ class FakeJobDetector:
         self.model_path.mkdir(exist_ok=True)
         
         self.model = None
-        self.tfidf_vectorizer = TfidfVectorizer(
-            max_features=500,
-            min_df=2,
-            max_df=0.8,
-            ngram_range=(1, 2)
+        self.onnx_session = None
+        # Hashed TF-IDF compressed to a dense embedding; kept under the old
+        # name so saved artifacts and predict() stay interchangeable
+        self.tfidf_vectorizer = make_pipeline(
+            HashingVectorizer(n_features=2**14, ngram_range=(1, 2), alternate_sign=False, dtype=np.float32),
+            TfidfTransformer(),
+            TruncatedSVD(n_components=TEXT_EMBEDDING_DIM, random_state=42)
         )
         self.scaler = None
         self.feature_extractor = FeatureExtractor()
@@ -38,64 +140,32 @@ class FakeJobDetector:
         """Prepare data for training"""
         print("[INFO] Preparing training data...")
         
-        X_text = []
-        X_features = []
-        y = []
-        
-        for idx, row in df.iterrows():
-            # Use 'text' column as description (our dataset format)
-            job_data = {
-                'description': row.get('text', ''),
-                'requirements': row.get('text', ''),  # Use text for requirements too
-                'company_profile': '',
-                'company_domain': '',
-                'company_name': '',
-                'salary': '',
-            }
-            
-            # Extract features
-            features, combined_text = self.feature_extractor.extract_all_features(job_data)
-            
-            X_text.append(combined_text)
-            X_features.append([
-                features['text_length'],
-                features['word_count'],
-                features['avg_word_length'],
-                features['unique_word_ratio'],
-                features['uppercase_ratio'],
-                features['digit_ratio'],
-                features['spelling_errors'],
-                features['grammar_score'],
-                features['sentence_count'],
-                features['domain_exists'],
-                features['domain_length'],
-                features['has_suspicious_domain'],
-                features['company_name_length'],
-                features['red_flag_count'],
-            ])
-            
-            y.append(row['label'])
-            
-            if (idx + 1) % 100 == 0:
-                print(f"  ✓ Processed {idx + 1} records")
+        # Our dataset has a single 'text' column, used as both description and requirements
+        texts = df['text'].fillna('').astype(str)
+        X_text, X_features = engineered_features(texts, self.feature_extractor)
+        y = df['label'].to_numpy()
+        print(f"  ✓ Processed {len(texts)} records")
         
-        # Vectorize text using TF-IDF
+        # Vectorize text: hashed TF-IDF reduced to a dense TEXT_EMBEDDING_DIM embedding
         print("[INFO] Vectorizing text with TF-IDF...")
-        X_tfidf = self.tfidf_vectorizer.fit_transform(X_text).toarray()
+        X_tfidf = self.tfidf_vectorizer.fit_transform(X_text).astype(np.float32)
         
         # Combine TF-IDF with engineered features
         X_combined = np.hstack([X_tfidf, X_features])
         
-        # Normalize features
-        self.scaler = StandardScaler()
-        X_combined = self.scaler.fit_transform(X_combined)
+        # Normalize features in place
+        self.scaler = fit_scaler_inplace(X_combined)
         
-        return X_combined, np.array(y)
+        return X_combined, y
     
     def build_model(self, input_dim):
         """Build deep learning model"""
         print("[INFO] Building neural network...")
         
+        # Half-precision activations on GPU; CPUs gain nothing from it
+        if tf.config.list_physical_devices('GPU'):
+            keras.mixed_precision.set_global_policy('mixed_float16')
+        
         self.model = Sequential([
             layers.Input(shape=(input_dim,)),
             
@@ -118,8 +188,8 @@ class FakeJobDetector:
             layers.Dense(64, activation='relu'),
             layers.Dropout(0.2),
             
-            # Output layer
-            layers.Dense(1, activation='sigmoid')
+            # Output layer (float32 keeps the sigmoid stable under mixed precision)
+            layers.Dense(1, activation='sigmoid', dtype='float32')
         ])
         
         self.model.compile(
@@ -143,7 +213,7 @@ class FakeJobDetector:
                 verbose=1
             ),
             ModelCheckpoint(
-                str(self.model_path / 'best_model.h5'),
+                str(self.model_path / 'best_model.keras'),
                 monitor='val_accuracy',
                 save_best_only=True,
                 verbose=1
@@ -151,10 +221,9 @@ class FakeJobDetector:
         ]
         
         history = self.model.fit(
-            X_train, y_train,
-            validation_data=(X_val, y_val),
+            _make_dataset(X_train, y_train, batch_size),
+            validation_data=_make_dataset(X_val, y_val, batch_size, shuffle=False),
             epochs=epochs,
-            batch_size=batch_size,
             callbacks=callbacks,
             verbose=1
         )
@@ -165,57 +234,133 @@ class FakeJobDetector:
         """Save trained model and preprocessors"""
         print("[INFO] Saving model...")
         
-        self.model.save(str(self.model_path / 'fake_job_detector.h5'))
-        joblib.dump(self.tfidf_vectorizer, str(self.model_path / 'tfidf_vectorizer.pkl'))
-        joblib.dump(self.scaler, str(self.model_path / 'scaler.pkl'))
+        self.model.save(str(self.model_path / KERAS_MODEL_NAME))
+        
+        # Only the fitted arrays are stored; load_model rebuilds the objects around them
+        tfidf = self.tfidf_vectorizer.named_steps['tfidftransformer']
+        svd = self.tfidf_vectorizer.named_steps['truncatedsvd']
+        np.savez(
+            self.model_path / PREPROCESSORS_NAME,
+            idf=tfidf.idf_,
+            components=svd.components_,
+            mean=self.scaler.mean_,
+            scale=self.scaler.scale_
+        )
+        
+        # An ONNX export of the previous weights would otherwise be served with
+        # these new preprocessors; re-run export_onnx for the new model
+        for stale in (self.model_path / ONNX_MODEL_NAME, self.model_path / ONNX_FP32_MODEL_NAME):
+            stale.unlink(missing_ok=True)
         
         print(f"[OK] Model saved to {self.model_path}")
     
+    def export_onnx(self, quantize=True):
+        """Convert the trained Keras model to ONNX, INT8-quantized by default"""
+        import tf2onnx
+        from onnxruntime.quantization import quantize_dynamic, QuantType
+        
+        print("[INFO] Exporting model to ONNX...")
+        
+        fp32_path = self.model_path / ONNX_FP32_MODEL_NAME
+        input_spec = (tf.TensorSpec((None, self.model.input_shape[1]), tf.float32, name='input'),)
+        tf2onnx.convert.from_keras(self.model, input_signature=input_spec, opset=17, output_path=str(fp32_path))
+        
+        if not quantize:
+            return fp32_path
+        
+        int8_path = self.model_path / ONNX_MODEL_NAME
+        quantize_dynamic(str(fp32_path), str(int8_path), weight_type=QuantType.QInt8)
+        
+        print(f"[OK] Quantized ONNX model saved to {int8_path}")
+        return int8_path
+    
     def load_model(self):
         """Load trained model and preprocessors"""
         print("[INFO] Loading model...")
         
-        self.model = keras.models.load_model(str(self.model_path / 'fake_job_detector.h5'))
-        self.tfidf_vectorizer = joblib.load(str(self.model_path / 'tfidf_vectorizer.pkl'))
-        self.scaler = joblib.load(str(self.model_path / 'scaler.pkl'))
+        # Prefer the quantized ONNX model, unless it predates the Keras model
+        # (exported before a retrain); fall back to Keras
+        onnx_path = self.model_path / ONNX_MODEL_NAME
+        keras_path = self.model_path / KERAS_MODEL_NAME
+        onnx_current = onnx_path.exists() and (
+            not keras_path.exists() or onnx_path.stat().st_mtime >= keras_path.stat().st_mtime
+        )
+        if ONNX_AVAILABLE and onnx_current:
+            sess_options = ort.SessionOptions()
+            sess_options.intra_op_num_threads = os.cpu_count() or 1
+            self.onnx_session = ort.InferenceSession(
+                str(onnx_path), sess_options, providers=['CPUExecutionProvider']
+            )
+        else:
+            if not keras_path.exists():
+                keras_path = self.model_path / LEGACY_MODEL_NAME
+            self.model = keras.models.load_model(str(keras_path))
+        
+        preprocessors_path = self.model_path / PREPROCESSORS_NAME
+        if preprocessors_path.exists():
+            self._load_preprocessors(preprocessors_path)
+        else:
+            self.tfidf_vectorizer = joblib.load(str(self.model_path / 'tfidf_vectorizer.pkl'))
+            self.scaler = joblib.load(str(self.model_path / 'scaler.pkl'))
         
         print("[OK] Model loaded successfully")
     
+    def _load_preprocessors(self, path):
+        """Restore the fitted TF-IDF/SVD pipeline and scaler from their saved arrays"""
+        with np.load(path) as arrays:
+            tfidf = self.tfidf_vectorizer.named_steps['tfidftransformer']
+            tfidf.idf_ = arrays['idf']
+            tfidf.n_features_in_ = tfidf.idf_.shape[0]
+            
+            svd = self.tfidf_vectorizer.named_steps['truncatedsvd']
+            svd.components_ = arrays['components']
+            svd.n_features_in_ = svd.components_.shape[1]
+            
+            self.scaler = StandardScaler()
+            self.scaler.mean_ = arrays['mean']
+            self.scaler.scale_ = arrays['scale']
+            self.scaler.n_features_in_ = self.scaler.mean_.shape[0]
+    
     def predict(self, job_data):
         """Predict if job is fake"""
+        return self.predict_batch([job_data])[0]
+    
+    def predict_batch(self, jobs):
+        """Predict many jobs with one vectorizer, scaler and model call.
+
+        Returns one result dict per job, in order, as predict does.
+        """
+        if not jobs:
+            return []
+        
         # Extract features
-        features, combined_text = self.feature_extractor.extract_all_features(job_data)
+        extracted = [self.feature_extractor.extract_all_features(job_data) for job_data in jobs]
         
-        # Vectorize text
-        X_tfidf = self.tfidf_vectorizer.transform([combined_text]).toarray()
+        # Vectorize all texts at once
+        X_tfidf = self.tfidf_vectorizer.transform([combined_text for _, combined_text in extracted])
+        if sparse.issparse(X_tfidf):
+            # Artifacts saved before the SVD embedding produce sparse TF-IDF rows
+            X_tfidf = X_tfidf.toarray()
         
         # Combine with features
-        X_features = np.array([[
-            features['text_length'],
-            features['word_count'],
-            features['avg_word_length'],
-            features['unique_word_ratio'],
-            features['uppercase_ratio'],
-            features['digit_ratio'],
-            features['spelling_errors'],
-            features['grammar_score'],
-            features['sentence_count'],
-            features['domain_exists'],
-            features['domain_length'],
-            features['has_suspicious_domain'],
-            features['company_name_length'],
-            features['red_flag_count'],
-        ]])
+        X_features = np.array([[features[name] for name in MODEL_FEATURES] for features, _ in extracted])
         
         X_combined = np.hstack([X_tfidf, X_features])
-        X_combined = self.scaler.transform(X_combined)
+        X_combined = self.scaler.transform(X_combined).astype(np.float32)
         
-        # Get prediction
-        prediction = self.model.predict(X_combined, verbose=0)[0][0]
+        # Get predictions; calling the model directly skips predict()'s per-call setup
+        if self.onnx_session is not None:
+            input_name = self.onnx_session.get_inputs()[0].name
+            predictions = self.onnx_session.run(None, {input_name: X_combined})[0][:, 0]
+        else:
+            predictions = self.model(X_combined, training=False).numpy()[:, 0]
         
-        return {
-            'confidence': float(prediction),
-            'is_fake': prediction > 0.5,
-            'red_flags': features['red_flags'],
-            'red_flag_count': features['red_flag_count'],
-        }
\ No newline at end of file
+        return [
+            {
+                'confidence': float(prediction),
+                'is_fake': prediction > 0.5,
+                'red_flags': features['red_flags'],
+                'red_flag_count': features['red_flag_count'],
+            }
+            for (features, _), prediction in zip(extracted, predictions)
+        ]
@@ -1,44 +1,154 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
 import time
+import importlib.util
+import threading
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from urllib.parse import urlparse
 
 import os
 
-# Try to import Selenium (optional dependency for server environments)
-# Try to import Selenium (optional dependency for server environments)
-SELENIUM_AVAILABLE = False
+# Try to import lxml (optional C parser for BeautifulSoup; html.parser otherwise)
 try:
-    from selenium import webdriver
-    from selenium.webdriver.common.by import By
-    from selenium.webdriver.support.ui import WebDriverWait
-    from selenium.webdriver.support import expected_conditions as EC
-    from selenium.webdriver.chrome.options import Options
-    from selenium.webdriver.chrome.service import Service
-    SELENIUM_AVAILABLE = True
+    import lxml
+    HTML_PARSER = 'lxml'
 except ImportError:
-    pass
+    HTML_PARSER = 'html.parser'
+
+# Selenium is optional (absent in some server environments) and heavy to import,
+# so only check that it is installed; the browser code paths import it on use
+SELENIUM_AVAILABLE = importlib.util.find_spec('selenium') is not None
+
+# Chrome content settings (2 = block): the scrapers only read text, so images,
+# fonts and media are never fetched. Stylesheets stay on - element text depends
+# on CSS visibility, and hidden page furniture would leak into descriptions
+CHROME_BLOCKED_CONTENT_PREFS = {
+    'profile.managed_default_content_settings.images': 2,
+    'profile.managed_default_content_settings.fonts': 2,
+    'profile.managed_default_content_settings.media_stream': 2,
+}
+
+# Largest page body we read; anything bigger is not a job posting
+MAX_PAGE_BYTES = 4 * 1024 * 1024
+
+# Longest Retry-After we honor; scrapes run inside a web request
+MAX_RETRY_AFTER = 5
+
+# Minimum seconds between requests to the same host, shared by all scrapers
+RATE_LIMIT_DELAY = float(os.getenv('SCRAPER_RATE_LIMIT_DELAY', 1.0))
+_next_request_at = {}
+_rate_limit_lock = threading.Lock()
+
+def _wait_for_host_slot(url):
+    """Block until the next request to url's host is allowed, then claim that slot"""
+    host = urlparse(url).netloc
+    with _rate_limit_lock:
+        now = time.monotonic()
+        slot = max(now, _next_request_at.get(host, now))
+        _next_request_at[host] = slot + RATE_LIMIT_DELAY
+    if slot > now:
+        time.sleep(slot - now)
+
+class _CappedRetry(Retry):
+    """Retry policy that honors Retry-After, but never sleeps longer than MAX_RETRY_AFTER"""
+    
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        return None if retry_after is None else min(retry_after, MAX_RETRY_AFTER)
+
+@lru_cache(maxsize=4096)
+def _netloc(url):
+    """Domain (netloc) of url, or "" - cached, since batch scrapes see the same links repeatedly"""
+    if not url:
+        return ""
+    try:
+        return urlparse(url).netloc
+    except ValueError:
+        # Malformed netloc, e.g. an unclosed IPv6 bracket
+        return ""
+
+# One connection pool for every scraper session in the process (urllib3 pools are
+# thread-safe), so keep-alive connections outlive the per-URL scraper instances.
+# Rate limits and transient server errors are retried with backoff; a read timeout
+# is not retried (each attempt could take the full timeout) and a failed connect
+# only once
+_HTTP_ADAPTER = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=32,
+    max_retries=_CappedRetry(
+        total=3,
+        connect=1,
+        read=False,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(['GET']),
+        backoff_factor=0.5,
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+)
 
 class BaseScraper(ABC):
     """Base class for job portal scrapers"""
     
+    # Result of the one-off Chrome launch probe, shared by every scraper instance
+    _selenium_probe = None
+    
     def __init__(self):
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate, br',
+            # Only the encodings urllib3 can decode here ('br' needs brotli installed)
+            'Accept-Encoding': ACCEPT_ENCODING,
             'Connection': 'keep-alive',
         }
         self.timeout = 15
+        
+        # Own headers and cookies per scraper, pooled keep-alive connections shared
+        # process-wide, so repeat fetches skip the TCP/TLS handshake
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.mount('https://', _HTTP_ADAPTER)
+        self.session.mount('http://', _HTTP_ADAPTER)
+    
+    def throttled_get(self, url, **kwargs):
+        """session.get, spaced at least RATE_LIMIT_DELAY apart per host"""
+        _wait_for_host_slot(url)
+        return self.session.get(url, **kwargs)
+    
+    def read_page(self, response):
+        """Body of a stream=True response, refusing pages over MAX_PAGE_BYTES before they fill memory"""
+        if int(response.headers.get('Content-Length') or 0) > MAX_PAGE_BYTES:
+            response.close()
+            raise Exception(f"Page exceeds the {MAX_PAGE_BYTES // (1024 * 1024)}MB size limit")
+        
+        body = bytearray()
+        for chunk in response.iter_content(chunk_size=65536):
+            body.extend(chunk)
+            if len(body) > MAX_PAGE_BYTES:
+                response.close()
+                raise Exception(f"Page exceeds the {MAX_PAGE_BYTES // (1024 * 1024)}MB size limit")
+        return bytes(body)
     
     @property
     def has_selenium(self):
-        """Check if Selenium/Chrome is available"""
+        """Check if Selenium/Chrome is available (Chrome is launched at most once per process)"""
+        if BaseScraper._selenium_probe is None:
+            BaseScraper._selenium_probe = self._probe_selenium()
+        return BaseScraper._selenium_probe
+    
+    def _probe_selenium(self):
+        """Launch and quit a headless Chrome to see whether browser scraping works here"""
         if not SELENIUM_AVAILABLE:
             return False
         try:
+            from selenium import webdriver
+            from selenium.webdriver.chrome.options import Options
+            
             chrome_options = Options()
             chrome_options.add_argument("--headless")
             chrome_options.add_argument("--no-sandbox")
@@ -61,12 +171,12 @@ class BaseScraper(ABC):
                 payload = {'api_key': api_key, 'url': url, 'render_js': 'true'}
                 proxy_url = 'https://api.scraperapi.com/?' + urlencode(payload)
                 print(f"  [ScraperAPI] Routing request through Residential Proxy...")
-                response = requests.get(proxy_url, timeout=45)
+                response = self.session.get(proxy_url, timeout=45, stream=True)
             else:
-                response = requests.get(url, headers=self.headers, timeout=timeout)
+                response = self.throttled_get(url, timeout=timeout, stream=True)
                 
             response.raise_for_status()
-            return BeautifulSoup(response.content, 'html.parser')
+            return BeautifulSoup(self.read_page(response), HTML_PARSER)
         except requests.exceptions.Timeout:
             raise Exception(f"Timeout fetching {url}: Request took too long")
         except requests.exceptions.ConnectionError:
@@ -84,27 +194,34 @@ class BaseScraper(ABC):
                 from urllib.parse import urlencode
                 payload = {'api_key': api_key, 'url': url, 'render_js': 'true'}
                 proxy_url = 'https://api.scraperapi.com/?' + urlencode(payload)
-                response = requests.get(proxy_url, timeout=45)
+                response = self.session.get(proxy_url, timeout=45, stream=True)
             else:
-                response = requests.get(url, headers=self.headers, timeout=self.timeout)
+                response = self.throttled_get(url, timeout=self.timeout, stream=True)
                 
             response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Remove script and style elements
-            for tag in soup(['script', 'style', 'nav', 'footer', 'header']):
-                tag.decompose()
-            
-            return soup.get_text(separator='\n', strip=True), soup
+            soup = BeautifulSoup(self.read_page(response), HTML_PARSER)
+            return self.extract_page_text(soup), soup
         except Exception as e:
             raise Exception(f"Failed to fetch page: {str(e)}")
     
+    def extract_page_text(self, soup):
+        """Visible page text; strips script, style and page chrome from soup in place"""
+        # Remove script and style elements
+        for tag in soup(['script', 'style', 'nav', 'footer', 'header']):
+            tag.decompose()
+        
+        return soup.get_text(separator='\n', strip=True)
+    
     def init_selenium_driver(self):
         """Initialize Selenium WebDriver (only if available)"""
         if not SELENIUM_AVAILABLE:
             raise Exception("Selenium is not available in this environment")
         
         try:
+            from selenium import webdriver
+            from selenium.webdriver.chrome.options import Options
+            from selenium.webdriver.chrome.service import Service
+            
             chrome_options = Options()
             chrome_options.add_argument("--headless")
             chrome_options.add_argument("--no-sandbox")
@@ -124,6 +241,7 @@ class BaseScraper(ABC):
             
             chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
             chrome_options.add_experimental_option('useAutomationExtension', False)
+            chrome_options.add_experimental_option('prefs', CHROME_BLOCKED_CONTENT_PREFS)
 
             import random
             user_agents = [
@@ -147,13 +265,8 @@ class BaseScraper(ABC):
         except Exception as e:
             raise Exception(f"Failed to initialize Selenium: {str(e)}")
     
-    def extract_domain_from_url(self, url):
-        """Extract domain from URL"""
-        try:
-            parsed = urlparse(url)
-            return parsed.netloc
-        except:
-            return ""
+    # Extract domain from URL
+    extract_domain_from_url = staticmethod(_netloc)
     
     def scrape_with_fallback(self, url, portal_name):
         """Scrape using requests first, fall back to Selenium if available"""
@@ -180,14 +293,6 @@ class BaseScraper(ABC):
             except Exception as e:
                 print(f"  [Selenium] Error during browser scraping: {str(e)}")
         
-        # If we got partial data from requests, check if it's usable
-        try:
-            job_data = self.scrape_with_requests(url)
-            if job_data and self.validate_job_data(job_data):
-                return job_data
-        except:
-            pass
-        
         raise Exception(
             f"Anti-Bot Protection Detected: {portal_name} blocks automated scanners. "
             "Please click the 'Text/Description' tab above and manually paste the job description to analyze it."
@@ -1,8 +1,74 @@
 import re
-from src.scrapers.base_scraper import BaseScraper, SELENIUM_AVAILABLE
+import json
+import html
+from src.scrapers.base_scraper import BaseScraper
 
-if SELENIUM_AVAILABLE:
-    from selenium.webdriver.common.by import By
+# JSON-LD descriptions are flat HTML fragments (<p>, <br>, <ul>, <li>, ...)
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+
+def _strip_html(fragment):
+    """Text of an HTML fragment, one stripped text run per line (like get_text(separator='\\n', strip=True))"""
+    runs = (html.unescape(run).strip() for run in _HTML_TAG_RE.split(fragment))
+    return '\n'.join(run for run in runs if run)
+
+# Candidate selectors per field, tried in order; the first with visible text wins
+_FIELD_SELECTORS = {
+    'title': [
+        "h1.jobsearch-JobInfoHeader-title",
+        "h1[data-testid='jobsearch-JobInfoHeader-title']",
+        "h1",
+    ],
+    'company': [
+        "div[data-company-name='true']",
+        "span[data-testid='company-name']",
+        "div[data-testid='inlineHeader-companyName']",
+    ],
+    'location': [
+        "div[data-testid='job-location']",
+        "span[data-testid='job-location']",
+        "div[data-testid='inlineHeader-companyLocation']",
+    ],
+    'description': [
+        "div#jobDescriptionText",
+        "div[data-testid='job-description']",
+        "div.jobsearch-jobDescriptionText",
+    ],
+}
+
+# Any description container counts as "the posting has rendered"
+_DESCRIPTION_CSS = ', '.join(_FIELD_SELECTORS['description'])
+
+# BeautifulSoup find() arguments for the requests path, tried in order
+_COMPANY_FIND_ARGS = (
+    {'attrs': {'data-company-name': 'true'}},
+    {'attrs': {'data-testid': 'company-name'}},
+    {'attrs': {'data-testid': 'inlineHeader-companyName'}},
+)
+_LOCATION_FIND_ARGS = (
+    {'attrs': {'data-testid': 'job-location'}},
+    {'attrs': {'data-testid': 'inlineHeader-companyLocation'}},
+)
+_DESCRIPTION_FIND_ARGS = (
+    {'id': 'jobDescriptionText'},
+    {'attrs': {'data-testid': 'job-description'}},
+    {'class_': 'jobsearch-jobDescriptionText'},
+)
+
+_EXTRACT_FIELDS_JS = """
+const selectors = arguments[0];
+const out = {};
+for (const field in selectors) {
+    for (const selector of selectors[field]) {
+        const elem = document.querySelector(selector);
+        const text = elem ? (elem.innerText || '').trim() : '';
+        if (text) {
+            out[field] = text;
+            break;
+        }
+    }
+}
+return out;
+"""
 
 
 class IndeedScraper(BaseScraper):
@@ -22,47 +88,38 @@ class IndeedScraper(BaseScraper):
     
     def scrape_with_requests(self, url):
         """Scrape Indeed using requests/BeautifulSoup"""
-        page_text, soup = self.get_page_text(url)
+        soup = self.get_soup(url)
+        
+        # Indeed embeds the full posting as JSON-LD in the initial HTML; prefer it.
+        # Read it before extract_page_text strips the script tags
+        structured = self._extract_from_json_ld(soup)
+        page_text = self.extract_page_text(soup)
+        title = structured.get('title', '')
+        company = structured.get('company', '')
+        location = structured.get('location', '')
+        description = structured.get('description', '')
         
         # Extract title
-        title = ""
-        title_tag = soup.find('h1')
+        title_tag = None if title else soup.find('h1')
         if title_tag:
             title = title_tag.get_text(strip=True)
         
         # Extract company
-        company = ""
-        company_selectors = [
-            {'attrs': {'data-company-name': 'true'}},
-            {'attrs': {'data-testid': 'company-name'}},
-            {'attrs': {'data-testid': 'inlineHeader-companyName'}},
-        ]
-        for sel in company_selectors:
+        for sel in (() if company else _COMPANY_FIND_ARGS):
             tag = soup.find('div', **sel) or soup.find('span', **sel)
             if tag:
                 company = tag.get_text(strip=True)
                 break
         
         # Extract location
-        location = ""
-        loc_selectors = [
-            {'attrs': {'data-testid': 'job-location'}},
-            {'attrs': {'data-testid': 'inlineHeader-companyLocation'}},
-        ]
-        for sel in loc_selectors:
+        for sel in (() if location else _LOCATION_FIND_ARGS):
             tag = soup.find('div', **sel) or soup.find('span', **sel)
             if tag:
                 location = tag.get_text(strip=True)
                 break
         
         # Extract description
-        description = ""
-        desc_selectors = [
-            {'id': 'jobDescriptionText'},
-            {'attrs': {'data-testid': 'job-description'}},
-            {'class_': 'jobsearch-jobDescriptionText'},
-        ]
-        for sel in desc_selectors:
+        for sel in (() if description else _DESCRIPTION_FIND_ARGS):
             tag = soup.find('div', **sel)
             if tag:
                 description = tag.get_text(separator='\n', strip=True)
@@ -94,81 +151,65 @@ class IndeedScraper(BaseScraper):
         
         return job_data
     
+    def _extract_from_json_ld(self, soup):
+        """Title, company, location and plain-text description from a JobPosting JSON-LD block"""
+        data = {}
+        for script in soup.find_all('script', type='application/ld+json'):
+            json_content = script.string
+            if not json_content or 'JobPosting' not in json_content:
+                continue
+            try:
+                job_json = json.loads(json_content)
+            except ValueError:
+                continue
+            if not isinstance(job_json, dict):
+                continue
+            
+            data['title'] = job_json.get('title', '')
+            org = job_json.get('hiringOrganization', {})
+            if isinstance(org, dict):
+                data['company'] = org.get('name', '')
+            loc = job_json.get('jobLocation', {})
+            if isinstance(loc, list):
+                loc = loc[0] if loc else {}
+            addr = loc.get('address', {}) if isinstance(loc, dict) else {}
+            if isinstance(addr, dict):
+                parts = [addr.get('addressLocality', ''), addr.get('addressRegion', '')]
+                data['location'] = ', '.join(p for p in parts if p)
+            # The description is served as an HTML fragment
+            description = job_json.get('description', '')
+            if description:
+                data['description'] = _strip_html(description)
+            break
+        return data
+    
     def scrape_with_selenium(self, url):
         """Scrape Indeed using Selenium (original method)"""
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.common.exceptions import TimeoutException
         driver = self.init_selenium_driver()
         try:
             driver.get(url)
-            job_data = self._extract_job_data_selenium(driver)
-            return job_data
+            try:
+                WebDriverWait(driver, 10, poll_frequency=0.2).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, _DESCRIPTION_CSS))
+                )
+            except TimeoutException:
+                pass  # Extract what did render; validate_job_data rejects a missing description
+            return self._extract_job_data_selenium(driver)
         finally:
             driver.quit()
     
     def _extract_job_data_selenium(self, driver):
         """Extract job details from Indeed page using Selenium"""
-        # Job title
-        title = ""
-        title_selectors = [
-            "h1.jobsearch-JobInfoHeader-title",
-            "h1[data-testid='jobsearch-JobInfoHeader-title']",
-            "h1"
-        ]
-        for selector in title_selectors:
-            try:
-                elem = driver.find_element(By.CSS_SELECTOR, selector)
-                if elem and elem.text.strip():
-                    title = elem.text.strip()
-                    break
-            except:
-                continue
-
-        # Company name
-        company = ""
-        company_selectors = [
-            "div[data-company-name='true']",
-            "span[data-testid='company-name']",
-            "div[data-testid='inlineHeader-companyName']",
-        ]
-        for selector in company_selectors:
-            try:
-                elem = driver.find_element(By.CSS_SELECTOR, selector)
-                if elem and elem.text.strip():
-                    company = elem.text.strip()
-                    break
-            except:
-                continue
-
-        # Location
-        location = ""
-        location_selectors = [
-            "div[data-testid='job-location']",
-            "span[data-testid='job-location']",
-            "div[data-testid='inlineHeader-companyLocation']",
-        ]
-        for selector in location_selectors:
-            try:
-                elem = driver.find_element(By.CSS_SELECTOR, selector)
-                if elem and elem.text.strip():
-                    location = elem.text.strip()
-                    break
-            except:
-                continue
-
-        # Description
-        description = ""
-        desc_selectors = [
-            "div#jobDescriptionText",
-            "div[data-testid='job-description']",
-            "div.jobsearch-jobDescriptionText",
-        ]
-        for selector in desc_selectors:
-            try:
-                elem = driver.find_element(By.CSS_SELECTOR, selector)
-                if elem and elem.text.strip():
-                    description = elem.text.strip()
-                    break
-            except:
-                continue
+        # One in-browser pass instead of a WebDriver round-trip per selector
+        data = driver.execute_script(_EXTRACT_FIELDS_JS, _FIELD_SELECTORS) or {}
+        title = data.get('title', '')
+        company = data.get('company', '')
+        location = data.get('location', '')
+        description = data.get('description', '')
 
         return {
             'title': title or 'Unknown Job Title',
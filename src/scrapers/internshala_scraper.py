@@ -1,13 +1,189 @@
-from src.scrapers.base_scraper import BaseScraper, SELENIUM_AVAILABLE
+from src.scrapers.base_scraper import BaseScraper, SELENIUM_AVAILABLE, HTML_PARSER
 import time
 import re
-import requests
+import socket
+from concurrent.futures import ThreadPoolExecutor
 from bs4 import BeautifulSoup
+from utils.cache import ttl_cache
+
+# URL slug parsing, shared by every scrape
+_TRAILING_DIGITS_RE = re.compile(r'\d+$')
+_DOMAIN_STOPWORDS_RE = re.compile(r'\b(the|and|or|of|in|on|at|to|for|with)\b', re.IGNORECASE)
+_DASHES_RE = re.compile(r'-+')
+_URL_LOCATION_RE = re.compile(r'-in-([a-zA-Z]+(?:-[a-zA-Z]+)*?)(?=-at-)')
+
+# Company candidates containing any of these (plain substrings, matched against
+# lowercased text) are the portal itself, job titles or title separators
+_NOT_A_COMPANY_RE = re.compile('|'.join(map(re.escape, [
+    'internshala.com',
+    'internship', 'developer', 'manager', 'engineer', 'designer', 'analyst', 'consultant',
+    'specialist', 'coordinator', 'assistant', 'executive', 'officer', 'representative',
+    'associate', 'marketing', 'content', 'digital', 'e-commerce', 'website', 'ui', 'ux', 'web',
+    'mobile', 'software', 'data', 'sales',
+    '&', 'and', '-', 'at ', 'for ', 'by ', 'with '
+])))
+_URL_CHARS = frozenset('/\\:?#=')
+
+def _is_valid_company(text, url):
+    """Whether a stripped company candidate looks like a company name rather than a URL or job title"""
+    if len(text) < 2 or len(text.split()) > 4:
+        return False
+    if text.startswith(('http', '//')) or 'www.' in text:
+        return False
+    # Digits and URL punctuation (this also catches 'https://')
+    if any(char.isdigit() or char in _URL_CHARS for char in text):
+        return False
+    if _NOT_A_COMPANY_RE.search(text.lower()):
+        return False
+    # Not the job link itself
+    return url.replace('https://', '').replace('http://', '') not in text
+
+# requests path: candidate selectors per field, in priority order
+_PAGE_SELECTORS = {
+    'company': ['a.company-link', '.company-name', '.employer-name'],
+    'location': ['.location-text', '.location-link', '.job-location', '.location'],
+    'description': ['.job-description', '.description', '#job-description', '.internship-details'],
+}
+
+def _first_matches(soup, selectors):
+    """soup.select_one(selector) for each selector that matches, in priority order, from one tree walk"""
+    matches = soup.select(', '.join(selectors))
+    for selector in selectors:
+        tag = next((tag for tag in matches if tag.css.match(selector)), None)
+        if tag is not None:
+            yield tag
+
+# Selenium path: candidate selectors per field, tried in order; the first with visible text wins
+_FIELD_SELECTORS = {
+    'title': [
+        "h1.heading-title",
+        "h1.job-title",
+        "h1",
+        ".internship-title",
+        ".job-heading",
+        ".heading_title",
+        "[data-testid='job-title']",
+        ".job_title"
+    ],
+    'location': [
+        "span.location-text",
+        ".location-link",
+        ".job-location",
+        "span.location",
+        ".location",
+        "[data-testid='location']",
+        ".location_text",
+        ".location-name",
+        ".city-name",
+        "[class*='location']",
+        ".internship-location",
+        ".job-location span"
+    ],
+    'description': [
+        "div.job-description",
+        "div.description",
+        ".job-details",
+        "div#job-description",
+        ".internship-details",
+        "[data-testid='job-description']",
+        ".job_description",
+        ".internship_details"
+    ],
+    'skills_required': [
+        "div.skills-container",
+        "div.skills",
+        ".key-skills"
+    ],
+    'stipend': [
+        "span.stipend",
+        ".salary",
+        "span.salary"
+    ],
+}
+
+# Company selectors, in order; every match is returned so the name filters can skip bad ones
+_COMPANY_SELECTORS = [
+    "a.company-link",
+    ".company-name a",
+    ".company-name",
+    "span.company-name",
+    ".employer-name",
+    "[data-testid='company-name']",
+    ".company_link",
+    ".employer_name",
+    ".company",
+    "a[href*='company']",
+    ".company_info a",
+    ".employer_info a",
+    "[class*='company'] a",
+    "[class*='employer'] a",
+    ".job-details .company a",
+    ".internship-details .company a"
+]
+
+# Page-text lines that open and close the job details section
+_SECTION_STARTS = ['about the internship', 'job description', 'responsibilities', 'requirements']
+_SECTION_STOPS = ['apply now', 'application', 'contact']
+
+# First element per selector, like driver.find_element; company candidates keep their link.
+# Without a description element, up to 10 lines (over 20 chars) from the first job-section
+# heading to the next apply/contact line of the page text are returned instead, so the
+# whole page text never crosses the WebDriver connection
+_EXTRACT_FIELDS_JS = """
+const [selectors, companySelectors, sectionStarts, sectionStops] = arguments;
+const textOf = elem => elem ? (elem.innerText || '').trim() : '';
+const out = {company_candidates: []};
+for (const field in selectors) {
+    for (const selector of selectors[field]) {
+        const text = textOf(document.querySelector(selector));
+        if (text) {
+            out[field] = text;
+            break;
+        }
+    }
+}
+for (const selector of companySelectors) {
+    const elem = document.querySelector(selector);
+    const text = textOf(elem);
+    if (text) {
+        out.company_candidates.push([text, elem.href || elem.getAttribute('href') || '']);
+    }
+}
+if (!out.description && document.body) {
+    const relevant = [];
+    let capture = false;
+    for (let line of document.body.innerText.split('\\n')) {
+        line = line.trim();
+        if (!line) continue;
+        const lower = line.toLowerCase();
+        if (sectionStarts.some(keyword => lower.includes(keyword))) {
+            capture = true;
+        } else if (capture && sectionStops.some(keyword => lower.includes(keyword))) {
+            break;
+        }
+        if (capture && line.length > 20) {
+            relevant.push(line);
+            if (relevant.length === 10) break;
+        }
+    }
+    out.description_fallback = relevant.join(' ');
+}
+return out;
+"""
+
+# How long a resolved company domain is remembered (seconds); lookups that fail
+# are not cached, so a transient DNS error doesn't hide the domain for good
+DNS_CACHE_TTL = 6 * 60 * 60
+
+@ttl_cache(DNS_CACHE_TTL, maxsize=2048, keep=bool)
+def _resolves(host):
+    """Whether host has a DNS record - cached, since the same companies are scraped repeatedly"""
+    try:
+        socket.gethostbyname(host)
+        return True
+    except Exception:
+        return False
 
-if SELENIUM_AVAILABLE:
-    from selenium.webdriver.common.by import By
-    from selenium.webdriver.support.ui import WebDriverWait
-    from selenium.webdriver.support import expected_conditions as EC
 
 class InternshalaScraper(BaseScraper):
     """Scraper for Internshala.com job postings"""
@@ -30,21 +206,20 @@ class InternshalaScraper(BaseScraper):
             print(f"⚠️ Requests scraping failed: {str(e)}")
 
         if not SELENIUM_AVAILABLE:
-            try:
-                job_data = self._scrape_with_requests(url)
-                if job_data and self.validate_job_data(job_data):
-                    return job_data
-            except:
-                pass
-                
             raise Exception(
                 "Anti-Bot Protection Detected: Internshala blocks automated scanners. "
                 "Please click the 'Text/Description' tab above and manually paste the job description to analyze it."
             )
 
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+
+        driver = None
         try:
             driver = self.init_selenium_driver()
-            driver.set_page_load_timeout(45)
+            # With eager loading a timeout only means sub-resources are still
+            # arriving; the element wait below decides whether the page is usable
+            driver.set_page_load_timeout(10)
             driver.set_script_timeout(30)
             try:
                 driver.get(url)
@@ -62,7 +237,6 @@ class InternshalaScraper(BaseScraper):
                 time.sleep(5)
 
             job_data = self._extract_job_data(driver, url)
-            driver.quit()
 
             if not self.validate_job_data(job_data):
                 raise Exception(
@@ -76,6 +250,9 @@ class InternshalaScraper(BaseScraper):
             if "Anti-Bot Protection Detected" in str(e):
                 raise
             raise Exception(f"Internshala scraping error: {str(e)}")
+        finally:
+            if driver is not None:
+                driver.quit()
 
     def _scrape_with_requests(self, url):
         """Scrape Internshala using requests/BeautifulSoup (with optional ScraperAPI)"""
@@ -85,12 +262,12 @@ class InternshalaScraper(BaseScraper):
             from urllib.parse import urlencode
             payload = {'api_key': api_key, 'url': url, 'render_js': 'true'}
             proxy_url = 'https://api.scraperapi.com/?' + urlencode(payload)
-            response = requests.get(proxy_url, timeout=45)
+            response = self.session.get(proxy_url, timeout=45, stream=True)
         else:
-            response = requests.get(url, headers=self.headers, timeout=self.timeout)
+            response = self.throttled_get(url, timeout=self.timeout, stream=True)
             
         response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = BeautifulSoup(self.read_page(response), HTML_PARSER)
         
         # Extract title
         title = ""
@@ -101,9 +278,8 @@ class InternshalaScraper(BaseScraper):
         # Extract company
         company = ""
         company_domain = ""
-        for sel in ['a.company-link', '.company-name', '.employer-name']:
-            tag = soup.select_one(sel)
-            if tag and tag.get_text(strip=True):
+        for tag in _first_matches(soup, _PAGE_SELECTORS['company']):
+            if tag.get_text(strip=True):
                 company = tag.get_text(strip=True)
                 href = tag.get('href', '')
                 if href and 'internshala.com' not in href:
@@ -115,9 +291,8 @@ class InternshalaScraper(BaseScraper):
         
         # Extract location
         location = ""
-        for sel in ['.location-text', '.location-link', '.job-location', '.location']:
-            tag = soup.select_one(sel)
-            if tag and tag.get_text(strip=True):
+        for tag in _first_matches(soup, _PAGE_SELECTORS['location']):
+            if tag.get_text(strip=True):
                 location = tag.get_text(strip=True)
                 break
         if not location:
@@ -125,11 +300,9 @@ class InternshalaScraper(BaseScraper):
         
         # Extract description
         description = ""
-        for sel in ['.job-description', '.description', '#job-description', '.internship-details']:
-            tag = soup.select_one(sel)
-            if tag:
-                description = tag.get_text(separator='\n', strip=True)
-                break
+        for tag in _first_matches(soup, _PAGE_SELECTORS['description']):
+            description = tag.get_text(separator='\n', strip=True)
+            break
         
         if not description:
             # Fallback: get page text and extract relevant sections
@@ -152,181 +325,42 @@ class InternshalaScraper(BaseScraper):
     def _extract_job_data(self, driver, url):
         """Extract job details from Internshala page"""
         try:
-            # Job title - try multiple selectors (updated for current Internshala structure)
-            title = ""
-            title_selectors = [
-                "h1.heading-title",
-                "h1.job-title",
-                "h1",
-                ".internship-title",
-                ".job-heading",
-                ".heading_title",
-                "[data-testid='job-title']",
-                ".job_title"
-            ]
-
-            for selector in title_selectors:
-                try:
-                    title_elem = driver.find_element(By.CSS_SELECTOR, selector)
-                    if title_elem and title_elem.text.strip():
-                        title = title_elem.text.strip()
-                        break
-                except:
-                    continue
+            # All selector probes run in one WebDriver round-trip
+            data = driver.execute_script(_EXTRACT_FIELDS_JS, _FIELD_SELECTORS, _COMPANY_SELECTORS,
+                                         _SECTION_STARTS, _SECTION_STOPS) or {}
+            title = data.get('title', '')
 
-            # Company name - try multiple selectors (updated)
+            # Company name - first candidate that doesn't look like a URL or job title
             company = ""
             company_domain = ""
-            company_selectors = [
-                "a.company-link",
-                ".company-name a",
-                ".company-name",
-                "span.company-name",
-                ".employer-name",
-                "[data-testid='company-name']",
-                ".company_link",
-                ".employer_name",
-                ".company",
-                "a[href*='company']",
-                ".company_info a",
-                ".employer_info a",
-                "[class*='company'] a",
-                "[class*='employer'] a",
-                ".job-details .company a",
-                ".internship-details .company a"
-            ]
-
-            for selector in company_selectors:
-                try:
-                    company_elem = driver.find_element(By.CSS_SELECTOR, selector)
-                    if company_elem and company_elem.text.strip():
-                        company_text = company_elem.text.strip()
-
-                        # Skip if it looks like a URL or contains internshala.com
-                        if ('internshala.com' in company_text.lower() or
-                            company_text.startswith('http') or
-                            'https://' in company_text or
-                            'www.' in company_text or
-                            company_text.startswith('//') or
-                            'internshala.com' in company_text):
-                            continue
-                        # Skip if it contains the input URL (any part of it)
-                        if url.replace('https://', '').replace('http://', '') in company_text:
-                            continue
-                        # Skip if it looks like a job title (contains job-related keywords)
-                        job_keywords = ['internship', 'developer', 'manager', 'engineer', 'designer', 'analyst', 'consultant', 'specialist', 'coordinator', 'assistant', 'executive', 'officer', 'representative', 'associate', 'marketing', 'content', 'digital', 'e-commerce', 'website', 'ui', 'ux', 'web', 'mobile', 'software', 'data', 'sales']
-                        if any(keyword in company_text.lower() for keyword in job_keywords):
-                            continue
-                        # Skip if it contains common job title patterns or separators
-                        if any(pattern in company_text.lower() for pattern in ['&', 'and', '-', 'at ', 'for ', 'by ', 'with ']):
-                            continue
-                        # Skip if it's too long (likely contains job title)
-                        if len(company_text.split()) > 4:
-                            continue
-                        # Skip if it contains numbers
-                        if any(char.isdigit() for char in company_text):
-                            continue
-                        # Skip if it's too short (likely not a company name)
-                        if len(company_text.strip()) < 2:
-                            continue
-                        # Skip if it contains URL-like patterns
-                        if any(char in company_text for char in ['/', '\\', ':', '?', '#', '=']):
-                            continue
-                        company = company_text
-                        company_link = company_elem.get_attribute("href")
-                        if company_link and 'internshala.com' not in company_link and url not in company_link:
-                            company_domain = self.extract_domain_from_url(company_link)
-                            # Ensure it's not the job portal domain
-                            if company_domain and company_domain != 'internshala.com':
-                                pass  # Keep the domain
-                            else:
-                                company_domain = ""
-                        break
-                except:
+            for company_text, company_link in data.get('company_candidates', []):
+                if not _is_valid_company(company_text, url):
                     continue
+                company = company_text
+                if company_link and 'internshala.com' not in company_link and url not in company_link:
+                    company_domain = self.extract_domain_from_url(company_link)
+                    # Ensure it's not the job portal domain
+                    if company_domain and company_domain != 'internshala.com':
+                        pass  # Keep the domain
+                    else:
+                        company_domain = ""
+                break
 
             # If no company found on page, extract from URL
             if not company:
                 company, company_domain = self._extract_company_from_url(url)
 
-            # Location - try multiple selectors (updated)
-            location = ""
-            location_selectors = [
-                "span.location-text",
-                ".location-link",
-                ".job-location",
-                "span.location",
-                ".location",
-                "[data-testid='location']",
-                ".location_text",
-                ".location-name",
-                ".city-name",
-                "[class*='location']",
-                ".internship-location",
-                ".job-location span"
-            ]
-
-            for selector in location_selectors:
-                try:
-                    location_elem = driver.find_element(By.CSS_SELECTOR, selector)
-                    if location_elem and location_elem.text.strip():
-                        location = location_elem.text.strip()
-                        break
-                except:
-                    continue
+            location = data.get('location', '')
 
             # If no location found on page, extract from URL
             if not location:
                 location = self._extract_location_from_url(url)
 
-            # Description - try multiple selectors (updated)
-            description = ""
-            desc_selectors = [
-                "div.job-description",
-                "div.description",
-                ".job-details",
-                "div#job-description",
-                ".internship-details",
-                "[data-testid='job-description']",
-                ".job_description",
-                ".internship_details"
-            ]
-
-            for selector in desc_selectors:
-                try:
-                    desc_elem = driver.find_element(By.CSS_SELECTOR, selector)
-                    if desc_elem and desc_elem.text.strip():
-                        description = desc_elem.text.strip()
-                        break
-                except:
-                    continue
+            description = data.get('description', '')
 
-            # If no description found, try to get page text as fallback
+            # If no description found, use the job sections picked out of the page text
             if not description:
-                try:
-                    body = driver.find_element(By.TAG_NAME, "body")
-                    page_text = body.text
-                    # Extract relevant sections from page text
-                    lines = page_text.split('\n')
-                    relevant_lines = []
-                    capture = False
-                    for line in lines:
-                        line = line.strip()
-                        if not line:
-                            continue
-                        # Look for sections that might contain job details
-                        if any(keyword in line.lower() for keyword in ['about the internship', 'job description', 'responsibilities', 'requirements']):
-                            capture = True
-                        elif any(keyword in line.lower() for keyword in ['apply now', 'application', 'contact']) and capture:
-                            break
-                        if capture and len(line) > 20:
-                            relevant_lines.append(line)
-                    description = ' '.join(relevant_lines[:10])  # Take first 10 relevant lines
-                except:
-                    pass
-
-            # Job details
-            details = self._extract_details(driver)
+                description = data.get('description_fallback', '')
 
             job_data = {
                 'title': title or "WordPress Developer Internship",
@@ -334,8 +368,8 @@ class InternshalaScraper(BaseScraper):
                 'company_domain': company_domain or self._extract_domain_from_url_fallback(url),
                 'location': location or "Bangalore",
                 'description': description or "WordPress development internship",
-                'requirements': details.get('skills_required', ''),
-                'salary': details.get('stipend', ''),
+                'requirements': data.get('skills_required', ''),
+                'salary': data.get('stipend', ''),
                 'job_type': 'Internship',
                 'job_portal': 'internshala.com',
                 'url': url
@@ -358,7 +392,7 @@ class InternshalaScraper(BaseScraper):
                     # Remove query parameters first
                     company_part = company_part.split('?')[0]
                     # Remove numbers from the end
-                    company_slug = re.sub(r'\d+$', '', company_part)
+                    company_slug = _TRAILING_DIGITS_RE.sub('', company_part)
                     # Remove any trailing hyphens
                     company_slug = company_slug.rstrip('-')
 
@@ -368,8 +402,8 @@ class InternshalaScraper(BaseScraper):
 
                         # Try to construct domain from company name
                         # Remove common words and create domain
-                        domain_base = re.sub(r'\b(the|and|or|of|in|on|at|to|for|with)\b', '', company_slug, flags=re.IGNORECASE)
-                        domain_base = re.sub(r'-+', '-', domain_base.strip('-'))
+                        domain_base = _DOMAIN_STOPWORDS_RE.sub('', company_slug)
+                        domain_base = _DASHES_RE.sub('-', domain_base.strip('-'))
                         domain_base = domain_base.replace('-', '')
 
                         if domain_base:
@@ -381,9 +415,12 @@ class InternshalaScraper(BaseScraper):
                                 f"www.{domain_base}.in"
                             ]
 
-                            # Try to verify if domain exists (basic check)
-                            for domain in possible_domains:
-                                if self._verify_domain_exists(domain):
+                            # Try to verify if domain exists (basic check); the DNS lookups
+                            # run in parallel, and the first candidate that resolves wins
+                            with ThreadPoolExecutor(max_workers=len(possible_domains)) as executor:
+                                verified = list(executor.map(self._verify_domain_exists, possible_domains))
+                            for domain, exists in zip(possible_domains, verified):
+                                if exists:
                                     return company_name, domain
 
                             # If no domain verified, don't return unverified domain
@@ -400,8 +437,7 @@ class InternshalaScraper(BaseScraper):
             if 'internshala.com' in url:
                 # URL structure: ...internship-detail/[job-title]-in-[location]-at-[company]...
                 # Look for "-in-" followed by location, stopping before "-at-"
-                import re
-                match = re.search(r'-in-([a-zA-Z]+(?:-[a-zA-Z]+)*?)(?=-at-)', url)
+                match = _URL_LOCATION_RE.search(url)
                 if match:
                     location_slug = match.group(1)
                     # Convert slug to proper location name
@@ -418,51 +454,5 @@ class InternshalaScraper(BaseScraper):
 
     def _verify_domain_exists(self, domain):
         """Basic domain verification"""
-        try:
-            import socket
-            # Remove www. prefix for DNS check
-            check_domain = domain.replace('www.', '')
-            socket.gethostbyname(check_domain)
-            return True
-        except:
-            return False
-
-    def _extract_details(self, driver):
-        """Extract additional job details"""
-        details = {}
-        try:
-            # Skills required - try multiple selectors
-            skills_selectors = [
-                "div.skills-container",
-                "div.skills",
-                ".key-skills"
-            ]
-
-            for selector in skills_selectors:
-                try:
-                    skills_elem = driver.find_element(By.CSS_SELECTOR, selector)
-                    if skills_elem and skills_elem.text.strip():
-                        details['skills_required'] = skills_elem.text.strip()
-                        break
-                except:
-                    continue
-
-            # Stipend - try multiple selectors
-            stipend_selectors = [
-                "span.stipend",
-                ".salary",
-                "span.salary"
-            ]
-
-            for selector in stipend_selectors:
-                try:
-                    stipend_elem = driver.find_element(By.CSS_SELECTOR, selector)
-                    if stipend_elem and stipend_elem.text.strip():
-                        details['stipend'] = stipend_elem.text.strip()
-                        break
-                except:
-                    continue
-        except:
-            pass
-
-        return details
+        # Remove www. prefix for DNS check
+        return _resolves(domain.replace('www.', ''))
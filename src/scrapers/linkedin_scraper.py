@@ -1,15 +1,9 @@
-from src.scrapers.base_scraper import BaseScraper, SELENIUM_AVAILABLE
+from src.scrapers.base_scraper import BaseScraper, SELENIUM_AVAILABLE, HTML_PARSER, CHROME_BLOCKED_CONTENT_PREFS
 import time
 import re
-import requests
 from bs4 import BeautifulSoup
 import os
 
-if SELENIUM_AVAILABLE:
-    from selenium.webdriver.common.by import By
-    from selenium.webdriver.support.ui import WebDriverWait
-    from selenium.webdriver.support import expected_conditions as EC
-    from selenium.webdriver.chrome.options import Options
 
 class LinkedInScraper(BaseScraper):
     """Scraper for LinkedIn job postings with authentication support"""
@@ -59,6 +53,8 @@ class LinkedInScraper(BaseScraper):
         # Try Selenium with authentication first for better results (only if available)
         driver = None
         if SELENIUM_AVAILABLE:
+            from selenium.webdriver.common.by import By
+            from selenium.webdriver.support.ui import WebDriverWait
             try:
                 print("🔄 Trying Selenium with authentication...")
                 driver = self._init_authenticated_driver()
@@ -127,6 +123,7 @@ class LinkedInScraper(BaseScraper):
 
     def _init_authenticated_driver(self):
         """Initialize Chrome driver with authentication options"""
+        from selenium.webdriver.chrome.options import Options
         chrome_options = Options()
         chrome_options.add_argument('--headless')
         chrome_options.add_argument('--no-sandbox')
@@ -136,6 +133,8 @@ class LinkedInScraper(BaseScraper):
         chrome_options.add_argument('--disable-blink-features=AutomationControlled')
         chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
         chrome_options.add_experimental_option('useAutomationExtension', False)
+        chrome_options.add_experimental_option('prefs', CHROME_BLOCKED_CONTENT_PREFS)
+        chrome_options.page_load_strategy = 'eager' # Don't wait for images/CSS to finish loading completely
         
         # Add user agent
         chrome_options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
@@ -207,6 +206,7 @@ class LinkedInScraper(BaseScraper):
     
     def _extract_job_data(self, driver):
         """Extract job details from LinkedIn page"""
+        from selenium.webdriver.common.by import By
         try:
             # Job title - try multiple selectors
             title = ""
@@ -357,6 +357,7 @@ class LinkedInScraper(BaseScraper):
     
     def _get_description(self, driver):
         """Extract job description from LinkedIn posting (generic - works for any job)"""
+        from selenium.webdriver.common.by import By
         try:
             # Give page time to fully render
             time.sleep(5)
@@ -435,6 +436,7 @@ class LinkedInScraper(BaseScraper):
 
     def _get_job_criteria(self, driver):
         """Extract job criteria (type, level, salary, etc.)"""
+        from selenium.webdriver.common.by import By
         criteria = {}
         try:
             criteria_elements = driver.find_elements(By.CSS_SELECTOR, "ul.description__job-criteria-list li")
@@ -546,13 +548,13 @@ class LinkedInScraper(BaseScraper):
                 from urllib.parse import urlencode
                 payload = {'api_key': api_key, 'url': url, 'render_js': 'true'}
                 proxy_url = 'https://api.scraperapi.com/?' + urlencode(payload)
-                response = requests.get(proxy_url, timeout=45)
+                response = self.session.get(proxy_url, timeout=45, stream=True)
             else:
-                response = requests.get(url, headers=headers, timeout=15)
+                response = self.throttled_get(url, timeout=20, stream=True)
                 
             response.raise_for_status()
 
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(self.read_page(response), HTML_PARSER)
 
             # Extract basic job data from HTML
             job_data = {
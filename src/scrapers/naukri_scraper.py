@@ -1,14 +1,9 @@
-from src.scrapers.base_scraper import BaseScraper, SELENIUM_AVAILABLE
+from src.scrapers.base_scraper import BaseScraper, SELENIUM_AVAILABLE, HTML_PARSER
 import time
 import re
-import requests
 from bs4 import BeautifulSoup
 import json
 
-if SELENIUM_AVAILABLE:
-    from selenium.webdriver.common.by import By
-    from selenium.webdriver.support.ui import WebDriverWait
-    from selenium.webdriver.support import expected_conditions as EC
 
 class NaukriScraper(BaseScraper):
     """Scraper for Naukri.com job postings"""
@@ -44,6 +39,9 @@ class NaukriScraper(BaseScraper):
                 "Please click the 'Text/Description' tab above and manually paste the job description to analyze it."
             )
 
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+
         driver = None
         try:
             driver = self.init_selenium_driver()
@@ -116,12 +114,12 @@ class NaukriScraper(BaseScraper):
             from urllib.parse import urlencode
             payload = {'api_key': api_key, 'url': url, 'render_js': 'true'}
             proxy_url = 'https://api.scraperapi.com/?' + urlencode(payload)
-            response = requests.get(proxy_url, timeout=45)
+            response = self.session.get(proxy_url, timeout=45, stream=True)
         else:
-            response = requests.get(url, headers=self.headers, timeout=self.timeout)
+            response = self.throttled_get(url, timeout=self.timeout, stream=True)
             
         response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = BeautifulSoup(self.read_page(response), HTML_PARSER)
         
         data = {}
         
@@ -175,6 +173,7 @@ class NaukriScraper(BaseScraper):
 
     def _extract_from_json_ld(self, driver):
         """Extract job data from JSON-LD structured data"""
+        from selenium.webdriver.common.by import By
         data = {}
         try:
             # Find all script tags with type application/ld+json
@@ -245,6 +244,7 @@ class NaukriScraper(BaseScraper):
     
     def _extract_job_data(self, driver, url):
         """Extract job details from Naukri page"""
+        from selenium.webdriver.common.by import By
         try:
             # First, try to extract from JSON-LD structured data
             json_ld_data = self._extract_from_json_ld(driver)
@@ -407,6 +407,7 @@ class NaukriScraper(BaseScraper):
     
     def _extract_job_details(self, driver):
         """Extract additional job details"""
+        from selenium.webdriver.common.by import By
         details = {}
         try:
             # Key skills - try multiple selectors
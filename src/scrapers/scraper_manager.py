@@ -1,3 +1,4 @@
+from urllib.parse import urlparse
 from src.scrapers.linkedin_scraper import LinkedInScraper
 from src.scrapers.naukri_scraper import NaukriScraper
 from src.scrapers.indeed_scraper import IndeedScraper
@@ -14,14 +15,23 @@ class ScraperManager:
     }
     
     @staticmethod
-    def scrape(url):
-        """Automatically detect portal and scrape"""
+    def scrape(url, parsed=None):
+        """Automatically detect portal and scrape
+
+        The portal is matched against the URL's host only. ``parsed`` is an
+        optional ``urlparse`` result for ``url`` that saves parsing it again.
+        """
         print(f"🔍 Detecting job portal from URL: {url}")
         
+        if parsed is None:
+            # Scheme-less input such as "www.naukri.com/..." still has a host
+            parsed = urlparse(url if '://' in url else 'https://' + url)
+        
         # Detect portal
         portal = None
+        host = (parsed.hostname or '').lower()
         for portal_name in ScraperManager.SCRAPERS.keys():
-            if portal_name in url.lower():
+            if host == portal_name or host.endswith('.' + portal_name):
                 portal = portal_name
                 break
         
@@ -35,6 +45,4 @@ class ScraperManager:
         scraper = scraper_class()
         
         # Scrape job data
-        job_data = scraper.scrape(url)
-        
-        return job_data
\ No newline at end of file
+        return scraper.scrape(url)
\ No newline at end of file
@@ -0,0 +1,40 @@
+"""Tests for the server-side analysis store."""
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.analysis_store import AnalysisStore
+
+
+class TestAnalysisStore:
+    """Test the in-process analysis store."""
+
+    def test_save_and_load(self):
+        """A saved analysis should be returned by its id."""
+        store = AnalysisStore()
+        analysis_id = store.save({'final_prediction': 'GENUINE JOB'})
+        assert store.load(analysis_id) == {'final_prediction': 'GENUINE JOB'}
+
+    def test_missing_id_returns_none(self):
+        """Unknown or empty ids should return None."""
+        store = AnalysisStore()
+        assert store.load('unknown') is None
+        assert store.load(None) is None
+
+    def test_expired_entry_returns_none(self):
+        """Entries past their TTL should not be returned."""
+        store = AnalysisStore(ttl=0)
+        analysis_id = store.save({'final_prediction': 'FAKE JOB'})
+        assert store.load(analysis_id) is None
+
+    def test_oldest_entry_evicted_at_capacity(self):
+        """The in-process store should not grow past max_entries."""
+        store = AnalysisStore(max_entries=2)
+        first = store.save({'n': 1})
+        second = store.save({'n': 2})
+        third = store.save({'n': 3})
+        assert store.load(first) is None
+        assert store.load(second) == {'n': 2}
+        assert store.load(third) == {'n': 3}
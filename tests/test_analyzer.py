@@ -0,0 +1,119 @@
+"""Tests for job text parsing in the analyzer."""
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.analyzer import JobAnalyzer
+
+
+@pytest.fixture
+def analyzer():
+    """Analyzer instance - the model and feature extractor load lazily, so parsing tests stay light."""
+    return JobAnalyzer()
+
+
+class TestParseJobText:
+    """Test structured extraction from pasted job text."""
+
+    def test_explicit_title_field(self, analyzer):
+        """An explicit 'Job Title:' field should win."""
+        job_data = analyzer._parse_job_text("Job Title: Backend Developer\nCompany: Acme LLC")
+        assert job_data['title'] == 'Backend Developer'
+
+    def test_structured_title(self, analyzer, sample_job_text):
+        """Known job titles should be recognised in free text."""
+        job_data = analyzer._parse_job_text(sample_job_text)
+        assert job_data['title'].startswith('Senior Software Engineer')
+
+    def test_structured_title_after_non_ascii_text(self, analyzer):
+        """Title matching should not be thrown off by multi-byte characters before it."""
+        text = "Stipend ₹ 25,000 – remote\nWe need a Data Scientist - Lead for our team"
+        job_data = analyzer._parse_job_text(text)
+        assert job_data['title'] == 'Data Scientist - Lead'
+
+    def test_repeated_line_title(self, analyzer):
+        """A line repeated near the top (common in scraped pages) should be taken as the title."""
+        job_data = analyzer._parse_job_text("Growth Hacker\nGrowth Hacker\nJoin our team today")
+        assert job_data['title'] == 'Growth Hacker'
+
+    def test_most_repeated_line_wins(self, analyzer):
+        """The most frequent line wins, not the first one to repeat."""
+        text = "Growth Hacker\nJoin Us\nJoin Us\nGrowth Hacker\nGrowth Hacker"
+        job_data = analyzer._parse_job_text(text)
+        assert job_data['title'] == 'Growth Hacker'
+
+    def test_repeated_line_company(self, analyzer):
+        """A repeated company-like line should be taken as the company."""
+        text = "Growth Hacker\nNimbus Tech Pvt\nGrowth Hacker\nNimbus Tech Pvt\nJoin our team today"
+        job_data = analyzer._parse_job_text(text)
+        assert job_data['company'] == 'Nimbus Tech Pvt'
+
+    def test_big_tech_company(self, analyzer):
+        """A big-tech brand is recognized only alongside its product context."""
+        assert analyzer._parse_job_text("Work on Google Cloud and Kubernetes")['company'] == 'Google'
+        assert analyzer._parse_job_text("Company: Orchard Foods\nWe grow apple trees")['company'] == 'Orchard Foods'
+
+    def test_company_field(self, analyzer):
+        """A 'Company Name:' field should be used as the company."""
+        job_data = analyzer._parse_job_text("Company Name: Foo Corp\nWe are hiring")
+        assert job_data['company'] == 'Foo Corp'
+
+    def test_domain_from_email(self, analyzer, sample_job_text):
+        """The company domain should come from the first email address."""
+        job_data = analyzer._parse_job_text(sample_job_text)
+        assert job_data['company_domain'] == 'techcorp.com'
+
+    def test_location_field(self, analyzer, sample_job_text):
+        """An explicit 'Location:' field should be extracted."""
+        job_data = analyzer._parse_job_text(sample_job_text)
+        assert job_data['location'] == 'San Francisco, CA'
+
+    def test_city_name(self, analyzer):
+        """Known city names should be matched on word boundaries."""
+        job_data = analyzer._parse_job_text("Data Analyst\nOffice in Bengaluru, India")
+        assert job_data['location'] == 'Bengaluru'
+
+    def test_city_requires_whole_word(self, analyzer):
+        """City names inside other words should not count."""
+        job_data = analyzer._parse_job_text("Data Analyst\nKotak Mahindra office, Pune")
+        assert job_data['location'] == 'Pune'
+
+    def test_salary(self, analyzer, sample_job_text):
+        """Salary figures should be extracted."""
+        job_data = analyzer._parse_job_text(sample_job_text)
+        assert job_data['salary'] == '$150,000'
+
+    def test_requirements(self, analyzer):
+        """Lines after a requirements heading should be captured."""
+        text = "Role: Intern\nRequirements:\n- Python\n- SQL\nApply now"
+        job_data = analyzer._parse_job_text(text)
+        assert job_data['requirements'] == '- Python - SQL'
+
+
+class TestLazyLoading:
+    """Test deferred model and feature extractor loading."""
+
+    def test_construction_is_lazy(self, analyzer):
+        """Creating an analyzer should not load the model or feature extractor."""
+        assert analyzer.model_loaded is None
+        assert 'detector' not in analyzer.__dict__
+        assert 'feature_extractor' not in analyzer.__dict__
+
+
+class TestFastPrediction:
+    """Test the rule-based scorer."""
+
+    def test_scores_are_clipped(self, analyzer):
+        """Scores should stay within [0, 1]."""
+        assert analyzer._fast_prediction({'red_flags_score': 100, 'suspicion_score': 5},
+                                         ['registration fee'] * 10) <= 1.0
+        assert analyzer._fast_prediction({'professional_term_ratio': 0.5, 'domain_exists': 1}, []) >= 0.0
+
+    def test_flag_categories(self):
+        """Red flags should be counted as critical, high-risk or other."""
+        from src.analyzer import _count_flag_categories
+        red_flags = ['Registration Fee', 'urgent hiring via whatsapp', 'Multiple contact methods specified']
+        assert _count_flag_categories(red_flags) == (3, 1, 1)
+
@@ -0,0 +1,71 @@
+"""Tests for domain reputation helpers."""
+import pytest
+import sys
+import os
+from datetime import datetime
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import domain_check
+
+
+class TestDomainAgeCache:
+    """Test WHOIS result caching."""
+
+    def test_whois_queried_once_per_domain(self, monkeypatch):
+        """Repeat lookups for the same domain should reuse the WHOIS answer."""
+        calls = []
+
+        def fake_whois(domain):
+            calls.append(domain)
+            return SimpleNamespace(creation_date=datetime(2015, 1, 1))
+
+        monkeypatch.setattr(domain_check, 'WHOIS_AVAILABLE', True)
+        monkeypatch.setattr(domain_check, 'whois', SimpleNamespace(whois=fake_whois), raising=False)
+        domain_check._lookup_domain_age.cache_clear()
+
+        first = domain_check.check_domain_reputation('cached-example.com')
+        second = domain_check.check_domain_reputation('cached-example.com')
+
+        assert calls == ['cached-example.com']
+        assert first['trust_level'] == second['trust_level'] == 'HIGH'
+        domain_check._lookup_domain_age.cache_clear()
+
+    def test_failed_lookup_not_cached(self, monkeypatch):
+        """A WHOIS failure should be retried on the next lookup instead of being reused."""
+        answers = [TimeoutError('slow whois'), SimpleNamespace(creation_date=datetime(2015, 1, 1))]
+
+        def fake_whois(domain):
+            answer = answers.pop(0)
+            if isinstance(answer, Exception):
+                raise answer
+            return answer
+
+        monkeypatch.setattr(domain_check, 'WHOIS_AVAILABLE', True)
+        monkeypatch.setattr(domain_check, 'whois', SimpleNamespace(whois=fake_whois), raising=False)
+        domain_check._lookup_domain_age.cache_clear()
+
+        assert domain_check.get_domain_age('flaky-example.com') is None
+        assert domain_check.get_domain_age('flaky-example.com')['creation_date'] == '2015-01-01'
+        domain_check._lookup_domain_age.cache_clear()
+
+    def test_suspicious_tld(self):
+        """Domains on throwaway TLDs should be flagged."""
+        is_suspicious, reason = domain_check.is_suspicious_domain('jobs-offer.xyz')
+        assert is_suspicious
+        assert '.xyz' in reason
+
+
+class TestAnalyzeDomainComplete:
+    """Test the combined domain analysis."""
+
+    def test_failures_return_neutral_result(self, monkeypatch):
+        """Errors inside the analysis should produce a neutral result, not an exception."""
+        def broken(domain):
+            raise RuntimeError('lookup failed')
+
+        monkeypatch.setattr(domain_check, 'check_domain_reputation', broken)
+        result = domain_check.analyze_domain_complete('acme.com Visit https://acme.com/careers')
+        assert result['reputation']['trust_level'] == 'UNKNOWN'
+        assert 'lookup failed' in result['suspicion_reason']
@@ -6,7 +6,7 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from utils.red_flags import count_red_flags, analyze_quality, categorize_severity
-from src.feature_extractor import FeatureExtractor
+from src.feature_extractor import FeatureExtractor, _count_syllables
 
 
 class TestRedFlagDetection:
@@ -126,3 +126,12 @@ class TestFeatureExtractor:
         """Should detect spelling quality."""
         features = extractor.extract_spelling_features("This is a well written sentence.")
         assert isinstance(features, dict)
+
+    def test_count_syllables(self):
+        """Syllables are vowel groups, minus a silent trailing 'e', at least one per word."""
+        assert _count_syllables("Engineer") == 3
+        assert _count_syllables("make") == 1
+        assert _count_syllables("the") == 1
+        assert _count_syllables("rhythm") == 1
+        assert _count_syllables("bcd") == 1
+        assert _count_syllables("Rhythm") == _count_syllables("rhythm")
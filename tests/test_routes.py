@@ -62,6 +62,20 @@ class TestAnalyzeEndpoint:
                                content_type='application/json')
         assert response.status_code == 400
 
+    def test_analyze_rejects_malformed_json(self, client):
+        """Analyze should treat malformed JSON as missing data."""
+        response = client.post('/api/analyze',
+                               data='{not json',
+                               content_type='application/json')
+        assert response.status_code == 400
+
+    def test_analyze_rejects_oversized_payload(self, client):
+        """Analyze should reject bodies larger than the payload limit."""
+        response = client.post('/api/analyze',
+                               data=json.dumps({'job_input': 'x' * (70 * 1024)}),
+                               content_type='application/json')
+        assert response.status_code == 413
+
     def test_analyze_text_input(self, client, sample_job_text):
         """Analyze should process valid text input."""
         response = client.post('/api/analyze',
@@ -95,6 +109,70 @@ class TestAnalyzeEndpoint:
         assert response.status_code in [200, 400, 500]
 
 
+class TestDetectInputType:
+    """Test input type auto-detection."""
+
+    def test_detects_url_scheme(self):
+        """Inputs with a URL scheme should be detected as URLs."""
+        from routes import detect_input_type
+        assert detect_input_type('https://example.org/careers/123') == 'url'
+        assert detect_input_type('www.example.org') == 'url'
+
+    def test_detects_portal_domain(self):
+        """Portal domains should be detected as URLs regardless of case."""
+        from routes import detect_input_type
+        assert detect_input_type('LinkedIn.com/jobs/view/12345') == 'url'
+
+    def test_detects_description_text(self, sample_job_text):
+        """Long descriptions with job keywords should be detected as text."""
+        from routes import detect_input_type
+        assert detect_input_type(sample_job_text) == 'text'
+
+
+class TestValidateJobInput:
+    """Test input validation helpers."""
+
+    def test_keywords_matched_case_insensitively(self):
+        """Upper-case section headings should count as professional keywords."""
+        from routes import validate_job_input
+        text = 'RESPONSIBILITIES: build things. REQUIREMENTS: Python. ' * 3
+        result = validate_job_input(text, 'text')
+        assert result['valid']
+        assert not any('professional sections' in w for w in result['warnings'])
+
+    def test_portal_detected_case_insensitively(self):
+        """Mixed-case portal URLs should resolve to the portal name."""
+        from routes import validate_job_input
+        result = validate_job_input('https://www.LinkedIn.com/jobs/view/12345', 'url')
+        assert result['portal'] == 'linkedin'
+
+
+    def test_portal_matched_on_host_only(self):
+        """Portal names elsewhere in the URL should not count as the portal."""
+        from routes import validate_job_input
+        result = validate_job_input('https://example.org/redirect?to=linkedin.com', 'url')
+        assert result['portal'] is None
+
+    def test_parsed_url_returned(self):
+        """URL validation should hand back the parsed URL for reuse."""
+        from routes import validate_job_input
+        result = validate_job_input('https://www.naukri.com/job-listings-123', 'url')
+        assert result['parsed_url'].hostname == 'www.naukri.com'
+
+    def test_shortener_host_flagged(self):
+        """Link shortener hosts should add a suspicious-URL warning."""
+        from routes import validate_job_input
+        result = validate_job_input('https://bit.ly/abc123', 'url')
+        assert any('link shortener' in w for w in result['warnings'])
+
+    def test_unsupported_host_rejected(self):
+        """URLs outside the supported portals should be invalid."""
+        from routes import validate_job_input
+        result = validate_job_input('https://example.org/careers/123', 'url')
+        assert result['valid'] is False
+        assert 'Unsupported job portal' in result['error']
+
+
 class TestSupportedPortals:
     """Test supported portals endpoint."""
 
@@ -106,6 +184,12 @@ class TestSupportedPortals:
         assert 'supported_portals' in data
         assert len(data['supported_portals']) == 4
 
+    def test_portals_are_cacheable(self, client):
+        """Static portal list should be served with long-lived cache headers."""
+        response = client.get('/api/supported-portals')
+        assert response.is_json
+        assert 'max-age=86400' in response.headers['Cache-Control']
+
     def test_portal_structure(self, client):
         """Each portal should have name, domain, url_example."""
         response = client.get('/api/supported-portals')
@@ -133,6 +217,18 @@ class TestBatchAnalyze:
                                content_type='application/json')
         assert response.status_code == 400
 
+    def test_batch_streams_ndjson_on_request(self, client):
+        """Batch should emit one JSON line per job when NDJSON is accepted."""
+        response = client.post('/api/analyze-batch',
+                               data=json.dumps({'jobs': [{'job_input': ''}, {'job_input': ''}]}),
+                               content_type='application/json',
+                               headers={'Accept': 'application/x-ndjson'})
+        assert response.status_code == 200
+        assert response.mimetype == 'application/x-ndjson'
+        lines = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+        assert sorted(line['index'] for line in lines) == [1, 2]
+        assert all(line['success'] is False for line in lines)
+
 
 class TestAnalysisEndpoint:
     """Test the /api/test-analysis endpoint."""
@@ -178,7 +274,27 @@ class TestPageRoutes:
         response = client.get('/result')
         assert response.status_code == 302  # Redirect to home
 
+    def test_result_page_renders_stored_analysis(self, client):
+        """Result page should render when the session points at a stored analysis."""
+        from routes import analysis_store
+        analysis_id = analysis_store.save({'final_prediction': 'GENUINE JOB'})
+        with client.session_transaction() as sess:
+            sess['analysis_id'] = analysis_id
+        response = client.get('/result')
+        assert response.status_code == 200
+
     def test_404_page(self, client):
         """Non-existent page should return 404."""
         response = client.get('/nonexistent-page')
         assert response.status_code == 404
+
+    def test_versioned_static_is_long_cached(self, client):
+        """Static URLs rendered in pages should carry a version and be cached long-term."""
+        html = client.get('/about').get_data(as_text=True)
+        assert 'css/style.css?v=' in html
+        response = client.get('/static/css/style.css?v=1')
+        assert response.status_code == 200
+        assert response.cache_control.immutable
+        assert response.cache_control.max_age == 31536000
+        assert 'Accept-Encoding' in response.vary
+        response.close()
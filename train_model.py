@@ -9,7 +9,6 @@ import numpy as np
 import os
 import sys
 from sklearn.model_selection import train_test_split
-from sklearn.preprocessing import StandardScaler
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.ensemble import RandomForestClassifier, GradientBoostingClassifier
 from sklearn.linear_model import LogisticRegression
@@ -35,7 +34,7 @@ except ImportError:
     from imblearn.over_sampling import SMOTE, ADASYN, BorderlineSMOTE
     from imblearn.combine import SMOTETomek, SMOTEENN
 
-from src.model_trainer import FakeJobDetector
+from src.model_trainer import FakeJobDetector, engineered_features, fit_scaler_inplace
 from src.feature_extractor import FeatureExtractor
 
 
@@ -104,44 +103,9 @@ def prepare_training_data_comparison(df):
     
     feature_extractor = FeatureExtractor()
     
-    X_text = []
-    X_features = []
-    y = []
-    
-    for idx, row in df.iterrows():
-        job_data = {
-            'description': row.get('text', ''),
-            'requirements': row.get('text', ''),
-            'company_profile': '',
-            'company_domain': '',
-            'company_name': '',
-            'salary': '',
-        }
-        
-        features, combined_text = feature_extractor.extract_all_features(job_data)
-        
-        X_text.append(combined_text)
-        X_features.append([
-            features['text_length'],
-            features['word_count'],
-            features['avg_word_length'],
-            features['unique_word_ratio'],
-            features['uppercase_ratio'],
-            features['digit_ratio'],
-            features['spelling_errors'],
-            features['grammar_score'],
-            features['sentence_count'],
-            features['domain_exists'],
-            features['domain_length'],
-            features['has_suspicious_domain'],
-            features['company_name_length'],
-            features['red_flag_count'],
-        ])
-        
-        y.append(row['label'])
-        
-        if (idx + 1) % 100 == 0:
-            print(f"  ✓ Processed {idx + 1} records")
+    X_text, X_features = engineered_features(df['text'].fillna('').astype(str), feature_extractor)
+    y = df['label'].to_numpy()
+    print(f"  ✓ Processed {len(X_text)} records")
     
     # Vectorize text using TF-IDF
     print("📊 Vectorizing text with TF-IDF...")
@@ -151,11 +115,10 @@ def prepare_training_data_comparison(df):
     # Combine TF-IDF with engineered features
     X_combined = np.hstack([X_tfidf, X_features])
     
-    # Normalize features
-    scaler = StandardScaler()
-    X_combined = scaler.fit_transform(X_combined)
+    # Normalize features in place
+    scaler = fit_scaler_inplace(X_combined)
     
-    return X_combined, np.array(y), tfidf, scaler
+    return X_combined, y, tfidf, scaler
 
 
 def apply_smote_oversampling(X, y, method='smote'):
@@ -0,0 +1,40 @@
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+
+
+def ttl_cache(ttl, maxsize=1024, keep=lambda result: result is not None):
+    """Like functools.lru_cache, but entries expire after ttl seconds and only
+    results for which keep(result) is true are stored, so a transient failure
+    is retried on the next call instead of being remembered
+    """
+    def decorator(func):
+        cache = OrderedDict()
+        lock = threading.Lock()
+
+        @wraps(func)
+        def wrapper(*args):
+            now = time.monotonic()
+            with lock:
+                entry = cache.get(args)
+                if entry is not None and entry[0] > now:
+                    cache.move_to_end(args)
+                    return entry[1]
+
+            result = func(*args)
+            if keep(result):
+                with lock:
+                    cache[args] = (now + ttl, result)
+                    cache.move_to_end(args)
+                    while len(cache) > maxsize:
+                        cache.popitem(last=False)
+            return result
+
+        def cache_clear():
+            with lock:
+                cache.clear()
+
+        wrapper.cache_clear = cache_clear
+        return wrapper
+    return decorator
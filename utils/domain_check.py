@@ -2,6 +2,9 @@ import re
 from urllib.parse import urlparse
 import socket
 from datetime import datetime
+from functools import lru_cache
+
+from utils.cache import ttl_cache
 
 try:
     import whois
@@ -9,6 +12,10 @@ try:
 except ImportError:
     WHOIS_AVAILABLE = False
 
+# How long a WHOIS answer is reused for the same domain (seconds); failed
+# lookups are not cached, so a slow WHOIS server only costs that one request
+WHOIS_CACHE_TTL = 24 * 60 * 60
+
 def get_company_domain(text):
     """Extract company domain from text or URL"""
     # If URL pasted
@@ -38,6 +45,7 @@ def extract_domain_from_url(url):
         return None
 
 
+@lru_cache(maxsize=4096)
 def is_suspicious_domain(domain):
     """Enhanced suspicious domain pattern detection"""
     if not domain or domain == "Not available":
@@ -89,14 +97,24 @@ def is_suspicious_domain(domain):
 
 
 def get_domain_age(domain):
-    """Get domain age and creation date with timeout"""
+    """Get domain age and creation date with timeout
+
+    WHOIS answers are cached per domain for up to WHOIS_CACHE_TTL seconds,
+    so repeat postings from the same employer skip the network lookup.
+    """
     if not WHOIS_AVAILABLE:
         return None
     
+    if not domain or domain == "Not available":
+        return None
+    
+    return _lookup_domain_age(domain)
+
+
+@ttl_cache(WHOIS_CACHE_TTL, maxsize=4096)
+def _lookup_domain_age(domain):
+    """WHOIS lookup behind get_domain_age"""
     try:
-        if not domain or domain == "Not available":
-            return None
-        
         # Set socket timeout to prevent hanging on Render
         old_timeout = socket.getdefaulttimeout()
         socket.setdefaulttimeout(5)  # 5 second max for WHOIS